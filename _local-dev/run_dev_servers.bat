@@ -15,7 +15,7 @@ if errorlevel 1 (
 )
 
 REM Run the development servers
-python run_dev_servers.py
+python run_dev_servers.py %*
 
 REM Keep the window open if there was an error
 if errorlevel 1 (
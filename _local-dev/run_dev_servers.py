@@ -9,27 +9,69 @@ Features:
 - Runs API test server on port 8000 (with stub data)
 - Runs web UI server on port 8080
 - Shows separate logs for each server in split console view
+- Multiplexes both servers' output through a single selector loop (POSIX)
+- Optional in-process mode (--inproc) that runs both servers as threads of this
+  interpreter instead of separate processes, for faster startup
 - Graceful shutdown when Ctrl+C is pressed
 - Cross-platform compatible
 
 Usage:
-    python run_dev_servers.py
+    python run_dev_servers.py [--inproc]
 
 The servers will be available at:
 - API Server: http://localhost:8000
 - Web UI: http://localhost:8080
 """
 
+import io
 import os
 import sys
 import time
+import queue
+import runpy
+import atexit
 import signal
+import argparse
+import selectors
 import threading
+import traceback
 import subprocess
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+# Server scripts, resolved once so the launcher works from any working directory
+REPO_ROOT = Path(__file__).resolve().parent.parent
+API_SERVER_SCRIPT = REPO_ROOT / "api" / "local-test" / "test_server.py"
+WEB_SERVER_SCRIPT = REPO_ROOT / "webserver.py"
+
+# Size of each read from a server's output pipe
+READ_CHUNK_SIZE = 64 * 1024
+# Longest partial line kept while waiting for a newline before it is flushed as-is
+MAX_LINE_BUFFER = 1024 * 1024
+# Color only when writing to a terminal that is likely to understand ANSI codes, and never
+# when NO_COLOR is set (https://no-color.org). Windows Terminal sets WT_SESSION; a TERM value
+# on Windows means an ANSI-capable terminal such as mintty or ConEmu.
+USE_COLOR = (
+    sys.stdout is not None and sys.stdout.isatty()
+    and not os.environ.get('NO_COLOR')
+    and (os.name != 'nt' or 'WT_SESSION' in os.environ or bool(os.environ.get('TERM')))
+)
+# Each server gets its own process group so it can be stopped along with any children it spawns.
+# process_group (Python 3.11+) does this without a new session and still lets CPython use posix_spawn.
+if os.name == 'nt':
+  PROCESS_GROUP_KWARGS = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+elif sys.version_info >= (3, 11):
+  PROCESS_GROUP_KWARGS = {'process_group': 0}
+else:
+  PROCESS_GROUP_KWARGS = {'start_new_session': True}
+# A larger kernel pipe buffer (Linux, Python 3.10+) lets a server keep writing through a burst
+# of log output instead of blocking until we catch up
+if sys.platform == 'linux' and sys.version_info >= (3, 10):
+  PIPE_KWARGS = {'pipesize': 1024 * 1024}
+else:
+  PIPE_KWARGS = {}
+
 
 class ColoredOutput:
   """Handle colored console output for different servers."""
@@ -50,9 +92,49 @@ class ColoredOutput:
   @classmethod
   def colorize(cls, text: str, color: str) -> str:
     """Colorize text with ANSI codes."""
-    if os.name == 'nt':  # Windows may not support colors in all terminals
+    if not USE_COLOR:
       return text
-    return f"{cls.COLORS.get(color, '')}{text}{cls.COLORS['reset']}"
+    return f"{cls.COLORS[color]}{text}\033[0m"
+
+
+class ThreadOutputRouter(io.TextIOBase):
+  """
+  Stand-in for sys.stdout and sys.stderr while the servers run in-process.
+
+  Text written from a registered server thread is cut into complete lines and
+  queued for the runner to prefix and print; anything written from other threads
+  goes straight to the real stream.
+  """
+
+  def __init__(self, stream, output_queue: queue.SimpleQueue):
+    super().__init__()
+    self.stream = stream
+    self.output_queue = output_queue
+    self.routes = {}  # thread ident -> (process_name, color)
+    self.partial = {}  # thread ident -> text written since that thread's last newline
+
+  def register(self, process_name: str, color: str):
+    """Route everything the calling thread writes to the given server's log."""
+    self.routes[threading.get_ident()] = (process_name, color)
+
+  def writable(self) -> bool:
+    return True
+
+  def write(self, s: str) -> int:
+    ident = threading.get_ident()
+    route = self.routes.get(ident)
+    if route is None:
+      return self.stream.write(s)
+
+    complete, newline, rest = (self.partial.pop(ident, '') + s).rpartition('\n')
+    if newline:
+      self.output_queue.put((*route, complete))
+    if rest:
+      self.partial[ident] = rest
+    return len(s)
+
+  def flush(self):
+    self.stream.flush()
 
 
 class ServerRunner:
@@ -61,110 +143,412 @@ class ServerRunner:
   def __init__(self):
     self.processes = []
     self.running = True
-    self.lock = threading.Lock()
+    # Set when monitoring should end, either on a shutdown signal or when a server exits
+    self.shutdown_event = threading.Event()
+    # Reader threads for the Windows fallback, created only when it is used
+    self.reader_pool: Optional[ThreadPoolExecutor] = None
+    # Output of servers running in-process (--inproc), as (process_name, color, text) tuples.
+    # A text of None means that server has exited; a bare None only wakes the monitor loop.
+    self.output_queue: Optional[queue.SimpleQueue] = None
+    self.output_router: Optional[ThreadOutputRouter] = None
+    # Self-pipe that wakes the selector loop when shutdown is requested from another thread
+    self.wakeup_r: Optional[int]
+    self.wakeup_w: Optional[int]
+    self.wakeup_r, self.wakeup_w = os.pipe()
+    os.set_blocking(self.wakeup_r, False)
+    os.set_blocking(self.wakeup_w, False)
+    # Held while writing to or closing the pipe, so the signal thread never writes to a closed (or reused) fd
+    self.wakeup_lock = threading.Lock()
+
+    # Colored "[name]" tags and the current "HH:MM:SS" string are cached so
+    # logging a line does not rebuild them every time
+    self.name_tags = {}
+    self.cached_second = -1
+    self.cached_timestamp = ""
+
+    # Child environment is built once and shared by every launch.
+    # UTF-8 output avoids encoding errors on Windows, and unbuffered output
+    # makes the servers' logs show up as they are written rather than in
+    # blocks once the pipe buffer fills.
+    self.child_env = {**os.environ, 'PYTHONIOENCODING': 'utf-8', 'PYTHONUNBUFFERED': '1'}
 
   def setup_signal_handlers(self):
-    """Setup signal handlers for graceful shutdown."""
+    """
+    Setup signal handling for graceful shutdown.
+
+    On POSIX, SIGINT and SIGTERM are blocked and collected by a dedicated thread
+    with sigwait(), so shutdown runs from normal thread context instead of an
+    asynchronous handler that could interrupt the main thread mid-operation.
+    Children inherit the blocked signal mask, so call this only after the
+    servers have been launched.
+    """
+    if hasattr(signal, 'pthread_sigmask'):
+      signals = {signal.SIGINT, signal.SIGTERM}
+      signal.pthread_sigmask(signal.SIG_BLOCK, signals)
+      threading.Thread(
+          target=self.wait_for_shutdown_signal,
+          args=(signals,),
+          daemon=True,
+          name="signal-waiter"
+      ).start()
+      return
+
+    # Windows has no sigwait, so fall back to regular signal handlers
     def signal_handler(_signum, _frame):
       print(f"\n{ColoredOutput.colorize('🛑 Shutdown signal received...', 'yellow')}")
-      self.stop_all_servers()
-      sys.exit(0)
+      self.running = False
+      self.notify_shutdown()
 
     signal.signal(signal.SIGINT, signal_handler)
     if hasattr(signal, 'SIGTERM'):
       signal.signal(signal.SIGTERM, signal_handler)
 
-  def log_with_prefix(self, process_name: str, line: str, color: str = 'white'):
-    """Log a line with server prefix and timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    prefix = f"[{timestamp}] [{process_name}]"
-    colored_prefix = ColoredOutput.colorize(prefix, color)
-
-    with self.lock:
-      print(f"{colored_prefix} {line.strip()}")
+  def wait_for_shutdown_signal(self, signals: set):
+    """Block until a shutdown signal arrives, then tell the monitor loop to stop."""
+    signal.sigwait(signals)
+    print(f"\n{ColoredOutput.colorize('🛑 Shutdown signal received...', 'yellow')}")
+    self.running = False
+    self.notify_shutdown()
+
+  def notify_shutdown(self):
+    """End monitoring and wake whichever loop is waiting for server output."""
+    self.shutdown_event.set()
+    if self.output_queue is not None:
+      self.output_queue.put(None)
+    with self.wakeup_lock:
+      if self.wakeup_w is None:
+        return  # Monitoring has finished and the wakeup pipe is closed
+      try:
+        os.write(self.wakeup_w, b'x')
+      except BlockingIOError:
+        pass  # The pipe is already full of wake-ups, so the loop will wake anyway
+      except OSError as e:
+        print(f"Error waking the output monitor: {e}")
+
+  def close_wakeup_pipe(self):
+    """Close both ends of the wakeup pipe once monitoring has finished; safe to call more than once."""
+    with self.wakeup_lock:
+      for fd in (self.wakeup_r, self.wakeup_w):
+        if fd is not None:
+          os.close(fd)
+      self.wakeup_r = self.wakeup_w = None
+
+  def format_log_line(self, process_name: str, line: str, color: str = 'white') -> str:
+    """Format a line with server prefix and timestamp, ready to be written."""
+    now = int(time.time())
+    if now != self.cached_second:
+      self.cached_second = now
+      self.cached_timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+
+    tag = self.name_tags.get((process_name, color))
+    if tag is None:
+      tag = self.name_tags[(process_name, color)] = ColoredOutput.colorize(f"[{process_name}]", color)
+
+    return f"[{self.cached_timestamp}] {tag} {line.strip()}\n"
+
+  def log(self, process_name: str, fmt: str, *args, color: str = 'white'):
+    """
+    Log a message with server prefix and timestamp.
+
+    Like the logging module, fmt is only %-formatted with args when the message
+    is actually written, so callers should pass values rather than pre-built strings.
+    """
+    sys.stdout.write(self.format_log_line(process_name, fmt % args if args else fmt, color))
 
-  def run_server_with_logging(self, command: list, process_name: str, color: str, cwd: Optional[str] = None):
-    """Run a server process and handle its output logging."""
+  def log_with_prefix(self, process_name: str, line: str, color: str = 'white'):
+    """Log an already formatted line with server prefix and timestamp."""
+    self.log(process_name, line, color=color)
+
+  def write_lines(self, lines: list):
+    """
+    Write a batch of formatted lines with a single write and flush.
+
+    Joining first keeps the batch in one write() call, so on Windows, where each
+    server has its own reader thread, batches never interleave without a lock.
+    """
+    sys.stdout.write(''.join(lines))
+    sys.stdout.flush()
+
+  def start_server(self, command: list, process_name: str, color: str,
+                   cwd: Optional[str] = None) -> Optional[subprocess.Popen]:
+    """Launch a server process with its output piped back to the runner."""
     try:
-      # Set environment to use UTF-8 encoding for Windows
-      env = os.environ.copy()
-      env['PYTHONIOENCODING'] = 'utf-8'
-
-      # Start the process
+      # Start the process. The pipe is binary and unbuffered because output is read
+      # straight from its file descriptor and decoded once per batch of lines.
       process = subprocess.Popen(
           command,
           stdout=subprocess.PIPE,
           stderr=subprocess.STDOUT,
-          universal_newlines=True,
-          bufsize=1,
+          bufsize=0,
+          close_fds=True,
           cwd=cwd,
-          env=env,
-          encoding='utf-8',
-          errors='replace'
+          env=self.child_env,
+          **PROCESS_GROUP_KWARGS,
+          **PIPE_KWARGS
       )
+    except (subprocess.SubprocessError, OSError) as e:
+      self.log(process_name, "Error running server: %s", e, color='red')
+      return None
+
+    # Keep our read end out of any later child, so the pipe reaches EOF as soon as this server exits
+    assert process.stdout is not None  # stdout is guaranteed to be a pipe due to stdout=subprocess.PIPE
+    os.set_inheritable(process.stdout.fileno(), False)
+
+    self.processes.append(process)
+    self.log(process_name, "Starting server: %s", ' '.join(command), color=color)
+    return process
+
+  def log_server_exit(self, process: subprocess.Popen, process_name: str, color: str):
+    """Report how a server process terminated."""
+    return_code = process.wait()
+    if return_code == 0:
+      self.log_with_prefix(process_name, "Server stopped normally", color)
+    else:
+      self.log(process_name, "Server stopped with exit code: %d", return_code, color='red')
+
+  def relay_output(self, process_name: str, color: str, buf: bytearray, chunk: bytes, out: list):
+    """
+    Append a chunk of server output to its buffer and format every complete line into out.
+
+    Everything up to the last newline is decoded in one go; the trailing partial
+    line stays in the buffer until the rest of it arrives.
+    """
+    buf.extend(chunk)
+    idx = buf.rfind(b'\n')
+    if idx >= 0:
+      for line in buf[:idx].decode('utf-8', errors='replace').splitlines():
+        out.append(self.format_log_line(process_name, line, color))
+      del buf[:idx + 1]
+
+    if len(buf) > MAX_LINE_BUFFER:
+      # The server is not sending newlines - flush rather than grow without bound
+      out.append(self.format_log_line(process_name, buf.decode('utf-8', errors='replace'), color))
+      buf.clear()
+
+  def run_server_with_logging(self, process: subprocess.Popen, process_name: str, color: str):
+    """
+    Relay a server's output on a dedicated thread.
+
+    Only used on Windows, where selectors cannot watch pipes.
+    """
+    assert process.stdout is not None  # stdout is guaranteed to be a pipe due to stdout=subprocess.PIPE
+    fd = process.stdout.fileno()
+    buf = bytearray()
+    try:
+      # Read output in large chunks and split it into lines ourselves
+      while self.running:
+        chunk = os.read(fd, READ_CHUNK_SIZE)
+        if not chunk:
+          break  # EOF - the server closed its output, so it has exited
 
-      self.processes.append(process)
-      self.log_with_prefix(process_name, f"Starting server: {' '.join(command)}", color)
+        out = []
+        self.relay_output(process_name, color, buf, chunk, out)
+        self.write_lines(out)
 
-      # Read output line by line
-      while self.running and process.poll() is None:
-        assert process.stdout is not None  # stdout is guaranteed to be a pipe due to stdout=subprocess.PIPE
-        line = process.stdout.readline()
-        if line:
-          self.log_with_prefix(process_name, line, color)
+      if buf:
+        self.log_with_prefix(process_name, buf.decode('utf-8', errors='replace'), color)
 
-      # Handle process termination
-      if process.poll() is not None:
-        return_code = process.returncode
-        if return_code == 0:
-          self.log_with_prefix(process_name, "Server stopped normally", color)
-        else:
-          self.log_with_prefix(process_name, f"Server stopped with exit code: {return_code}", 'red')
+      # Handle process termination, reaping it so it does not linger as a zombie
+      self.log_server_exit(process, process_name, color)
 
     except (subprocess.SubprocessError, OSError) as e:
-      self.log_with_prefix(process_name, f"Error running server: {e}", 'red')
+      self.log(process_name, "Error running server: %s", e, color='red')
+
+    finally:
+      # One server going away ends monitoring for all of them
+      self.shutdown_event.set()
 
-  def start_api_server(self):
+  def start_api_server(self) -> Optional[subprocess.Popen]:
     """Start the API test server."""
-    api_path = Path(__file__).parent / ".." / "api" / "local-test"
-    command = [sys.executable, "test_server.py"]
-
-    thread = threading.Thread(
-        target=self.run_server_with_logging,
-        args=(command, "API-SERVER", "cyan", str(api_path)),
-        daemon=True
-    )
-    thread.start()
-    return thread
-
-  def start_web_server(self):
+    command = [sys.executable, str(API_SERVER_SCRIPT)]
+    return self.start_server(command, "API-SERVER", "cyan", str(API_SERVER_SCRIPT.parent))
+
+  def start_web_server(self) -> Optional[subprocess.Popen]:
     """Start the web UI server."""
-    web_path = Path(__file__).parent / ".."
-    command = [sys.executable, "webserver.py"]
+    command = [sys.executable, str(WEB_SERVER_SCRIPT)]
+    return self.start_server(command, "WEB-SERVER", "green", str(WEB_SERVER_SCRIPT.parent))
+
+  def monitor_servers(self, servers: list):
+    """
+    Relay output from all servers until one of them exits.
+
+    Every server's stdout pipe is registered with a single selector and put in
+    non-blocking mode, so one thread wakes only when a pipe has data and relays
+    whatever arrived. Lines gathered in one wakeup are written out together.
+    The wakeup pipe is registered too, so a shutdown request ends the wait
+    immediately and the loop never needs a timeout.
+    """
+    sel = selectors.DefaultSelector()
+    sel.register(self.wakeup_r, selectors.EVENT_READ, data=None)
+    for process, process_name, color in servers:
+      assert process.stdout is not None  # stdout is guaranteed to be a pipe due to stdout=subprocess.PIPE
+      os.set_blocking(process.stdout.fileno(), False)
+      sel.register(process.stdout, selectors.EVENT_READ, data=(process, process_name, color, bytearray()))
+
+    try:
+      while not self.shutdown_event.is_set():
+        out = []
+        for key, _mask in sel.select():
+          if key.data is None:
+            continue  # Woken by notify_shutdown(), which has already set shutdown_event
 
-    thread = threading.Thread(
-        target=self.run_server_with_logging,
-        args=(command, "WEB-SERVER", "green", str(web_path)),
-        daemon=True
-    )
-    thread.start()
-    return thread
+          process, process_name, color, buf = key.data
+          try:
+            chunk = os.read(key.fd, READ_CHUNK_SIZE)
+          except BlockingIOError:
+            continue
+
+          if not chunk:
+            # EOF - the server closed its output, so it has exited
+            if buf:
+              out.append(self.format_log_line(process_name, buf.decode('utf-8', errors='replace'), color))
+            self.write_lines(out)
+            sel.unregister(key.fileobj)
+            self.log_server_exit(process, process_name, color)
+            return
+
+          self.relay_output(process_name, color, buf, chunk, out)
+
+        if out:
+          self.write_lines(out)
+    finally:
+      sel.close()
+
+  def monitor_servers_threaded(self, servers: list):
+    """Relay output from all servers using one pooled reader thread each (Windows)."""
+    self.reader_pool = ThreadPoolExecutor(max_workers=len(servers), thread_name_prefix="srv-log")
+    for process, process_name, color in servers:
+      self.reader_pool.submit(self.run_server_with_logging, process, process_name, color)
+
+    # Keep the main thread alive until a reader finishes or a shutdown signal arrives.
+    # The wait is bounded because a blocked Event.wait() cannot be interrupted on
+    # Windows, which would stop the Ctrl+C handler from ever running.
+    while not self.shutdown_event.wait(timeout=1.0):
+      pass
+
+  def run_server_inproc(self, script: Path, process_name: str, color: str):
+    """Run a server script on the current thread as if it had been launched as __main__."""
+    # Both are set up by run_inproc() before any server thread starts
+    assert self.output_queue is not None and self.output_router is not None
+    self.output_router.register(process_name, color)
+    print(f"Starting server in-process: {script}")
+    try:
+      runpy.run_path(str(script), run_name="__main__")
+      self.output_queue.put((process_name, color, "Server stopped normally"))
+    except SystemExit as e:
+      self.output_queue.put((process_name, 'red' if e.code else color, f"Server exited with code: {e.code}"))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      traceback.print_exc()
+      self.output_queue.put((process_name, 'red', f"Server stopped with error: {e}"))
+    finally:
+      self.output_queue.put((process_name, color, None))
+
+  def monitor_servers_inproc(self):
+    """Relay queued output from in-process servers until one of them exits."""
+    assert self.output_queue is not None
+    # A blocked get() cannot be interrupted by Ctrl+C on Windows, so wait in slices there
+    timeout = 1.0 if os.name == 'nt' else None
+
+    while not self.shutdown_event.is_set():
+      try:
+        items = [self.output_queue.get(timeout=timeout)]
+      except queue.Empty:
+        continue
+      while not self.output_queue.empty():
+        items.append(self.output_queue.get_nowait())
+
+      out = []
+      for item in items:
+        if item is None:
+          continue
+        process_name, color, text = item
+        if text is None:
+          # One server going away ends monitoring for all of them
+          self.shutdown_event.set()
+          continue
+        for line in text.splitlines():
+          out.append(self.format_log_line(process_name, line, color))
+
+      if out:
+        self.write_lines(out)
+
+  def run_inproc(self):
+    """Run both servers as threads of this process, relaying their output."""
+    self.print_startup_banner()
+
+    # Block shutdown signals before any server thread starts so they all inherit the mask
+    self.setup_signal_handlers()
+    # webserver.py serves its static files relative to the working directory
+    os.chdir(REPO_ROOT)
+
+    self.output_queue = queue.SimpleQueue()
+    self.output_router = ThreadOutputRouter(sys.stdout, self.output_queue)
+    real_stdout, real_stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = self.output_router
+
+    try:
+      # Server threads are daemons: uvicorn cannot be stopped from outside its own
+      # thread, so they simply end with the process
+      for script, process_name, color in ((API_SERVER_SCRIPT, "API-SERVER", "cyan"),
+                                          (WEB_SERVER_SCRIPT, "WEB-SERVER", "green")):
+        threading.Thread(
+            target=self.run_server_inproc,
+            args=(script, process_name, color),
+            daemon=True,
+            name=process_name
+        ).start()
+
+      self.wait_for_startup()
+      self.monitor_servers_inproc()
+
+      if self.running:
+        print(f"\n{ColoredOutput.colorize('❌ One or more servers stopped unexpectedly', 'red')}")
+
+    finally:
+      sys.stdout, sys.stderr = real_stdout, real_stderr
+      self.close_wakeup_pipe()
+      print(f"{ColoredOutput.colorize('👋 All servers stopped. Goodbye!', 'green')}")
 
   def stop_all_servers(self):
     """Stop all running server processes."""
     self.running = False
+    self.shutdown_event.set()
 
     for process in self.processes:
       try:
-        if process.poll() is None:  # Process is still running          process.terminate()
+        if process.poll() is None:  # Process is still running
+          self.signal_server_group(process)
           # Give it a moment to terminate gracefully
           try:
             process.wait(timeout=5)
           except subprocess.TimeoutExpired:
-            process.kill()
+            self.signal_server_group(process, force=True)
+            process.wait()
       except (subprocess.SubprocessError, OSError, AttributeError) as e:
         print(f"Error stopping process: {e}")
 
+    # With the servers gone their pipes hit EOF, so the reader threads finish on their own
+    if self.reader_pool is not None:
+      self.reader_pool.shutdown(wait=True, cancel_futures=True)
+
+    # Close our end of each pipe so nothing is left blocked reading it
+    for process in self.processes:
+      if process.stdout is not None:
+        process.stdout.close()
+
+    # The selector loop has exited by now, so nothing is waiting on the wakeup pipe any more
+    self.close_wakeup_pipe()
+
+  def signal_server_group(self, process: subprocess.Popen, force: bool = False):
+    """Ask a server's whole process group to stop, or kill it outright if force is set."""
+    if os.name == 'nt':
+      if force:
+        process.kill()
+      else:
+        process.send_signal(signal.CTRL_BREAK_EVENT)
+    else:
+      os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+
   def print_startup_banner(self):
     """Print the startup banner with server information."""
     banner = f"""
@@ -193,7 +577,7 @@ Starting development environment with:
 
   def wait_for_startup(self):
     """Wait a moment for servers to start and show status."""
-    time.sleep(2)
+    self.shutdown_event.wait(timeout=2)
     print(f"\n{ColoredOutput.colorize('✅ Servers should be starting up...', 'green')}")
     print(f"{ColoredOutput.colorize('🌐 Web UI:', 'green')} http://localhost:8080")
     print(f"{ColoredOutput.colorize('🔧 API Server:', 'cyan')} http://localhost:8000")
@@ -202,24 +586,32 @@ Starting development environment with:
 
   def run(self):
     """Run both servers with monitoring."""
-    self.setup_signal_handlers()
     self.print_startup_banner()
 
+    # Make sure the servers are reaped even if we exit without reaching the finally below
+    atexit.register(self.stop_all_servers)
+
     try:
       # Start both servers
-      api_thread = self.start_api_server()
-      web_thread = self.start_web_server()
+      api_process = self.start_api_server()
+      web_process = self.start_web_server()
+      if api_process is None or web_process is None:
+        return
 
+      self.setup_signal_handlers()
       self.wait_for_startup()
 
-      # Keep the main thread alive and monitor
-      while self.running:
-        time.sleep(1)
+      servers = [
+          (api_process, "API-SERVER", "cyan"),
+          (web_process, "WEB-SERVER", "green"),
+      ]
+      if os.name == 'nt':
+        self.monitor_servers_threaded(servers)
+      else:
+        self.monitor_servers(servers)
 
-        # Check if any critical threads have died
-        if not api_thread.is_alive() or not web_thread.is_alive():
-          print(f"\n{ColoredOutput.colorize('❌ One or more servers stopped unexpectedly', 'red')}")
-          break
+      if self.running:
+        print(f"\n{ColoredOutput.colorize('❌ One or more servers stopped unexpectedly', 'red')}")
 
     except KeyboardInterrupt:
       print(f"\n{ColoredOutput.colorize('🛑 Received shutdown signal', 'yellow')}")
@@ -231,20 +623,31 @@ Starting development environment with:
 
 def main():
   """Main function to start the development environment."""
-  # Check if we're in the right directory
-  if not Path("../webserver.py").exists():
-    print(f"{ColoredOutput.colorize('❌ Error: webserver.py not found in current directory', 'red')}")
-    print("Please run this script from the '_local_dev' folder of the resonite-headless-manager repository")
+  parser = argparse.ArgumentParser(description="Run the API test server and web UI server for local development.")
+  parser.add_argument(
+      "--inproc",
+      action="store_true",
+      help="run both servers as threads of this process instead of separate Python processes"
+  )
+  args = parser.parse_args()
+
+  # Check the script still sits in the '_local-dev' folder of the repository
+  if not WEB_SERVER_SCRIPT.is_file():
+    print(f"{ColoredOutput.colorize('❌ Error: webserver.py not found', 'red')}")
+    print(f"Expected: {WEB_SERVER_SCRIPT}")
     sys.exit(1)
 
-  if not Path("../api/local-test/test_server.py").exists():
+  if not API_SERVER_SCRIPT.is_file():
     print(f"{ColoredOutput.colorize('❌ Error: API test server not found', 'red')}")
-    print("Expected: api/local-test/test_server.py")
+    print(f"Expected: {API_SERVER_SCRIPT}")
     sys.exit(1)
 
   # Start the development environment
   runner = ServerRunner()
-  runner.run()
+  if args.inproc:
+    runner.run_inproc()
+  else:
+    runner.run()
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ else
 fi
 
 # Run the development servers
-$PYTHON_CMD run_dev_servers.py
+$PYTHON_CMD run_dev_servers.py "$@"
 
 # Exit with the same code as the Python script
 exit $?
@@ -7,14 +7,14 @@ cleanup, and thread safety. Uses mock data to test all cache operations
 without requiring external dependencies.
 """
 
-import asyncio
-import json
+import io
 import logging
+import os
 import random
 import threading
 import time
 import sys
-import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict
@@ -26,6 +26,7 @@ sys.path.insert(0, str(project_root / "cacheing"))
 try:
   from cache_manager import (  # pylint: disable=import-error
       CacheManager,
+      NS_PER_SECOND,
       get_global_cache,
       cleanup_global_cache,
       CacheStatus
@@ -36,14 +37,23 @@ except ImportError as e:
   sys.exit(1)
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging; the cache manager's own log output is only shown when CACHE_TEST_VERBOSE=1
+if os.environ.get("CACHE_TEST_VERBOSE") == "1":
+  logging.basicConfig(
+      level=logging.INFO,
+      format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+  )
+else:
+  cache_logger = logging.getLogger("cache_manager")
+  cache_logger.addHandler(logging.NullHandler())
+  cache_logger.setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
+# Field names of each generated user record, in order
+_USER_KEYS = ("name", "id", "ping", "fps")
+
+
 class MockDataGenerator:
   """
   Mock data generator for testing cache operations.
@@ -51,42 +61,60 @@ class MockDataGenerator:
   Generates realistic test data for various cache scenarios.
   """
 
-  def __init__(self):
+  def __init__(self, seed: int = None):
     """Initialize the mock data generator."""
+    # Private generator so the tests do not contend on the module-level random state
+    self._rng = random.Random(seed)
     self.users = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank"]
     self.worlds = ["Main Hall", "Workshop", "Lobby", "Testing Area", "Private Room"]
     self.commands = ["users", "worlds", "status", "bans", "focus", "restart"]
 
+    # ISO timestamp of the current second, reformatted only when the second changes
+    self.last_second = 0
+    self.last_timestamp = ""
+
   def generate_user_data(self, count: int = None) -> Dict[str, Any]:
     """Generate mock user data."""
     if count is None:
-      count = random.randint(1, len(self.users))
-
-    selected_users = random.sample(self.users, min(count, len(self.users)))
+      count = self._rng.randint(1, len(self.users))
+
+    selected_users = self._rng.sample(self.users, min(count, len(self.users)))
+    # Draw each field for every user in one batch rather than one call per user
+    count = len(selected_users)
+    ids = self._rng.choices(range(100, 1000), k=count)
+    pings = self._rng.choices(range(20, 151), k=count)
+    fpses = self._rng.choices(range(60, 121), k=count)
     return {
         "users": [
-            {
-                "name": user,
-                "id": f"U-{user.lower()}{random.randint(100, 999)}",
-                "ping": random.randint(20, 150),
-                "fps": random.randint(60, 120)
-            }
-            for user in selected_users
+            dict(zip(_USER_KEYS, (user, f"U-{user.lower()}{user_id}", ping, fps)))
+            for user, user_id, ping, fps in zip(selected_users, ids, pings, fpses)
         ],
         "total_count": len(selected_users),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": self._current_timestamp()
     }
 
+  def _current_timestamp(self) -> str:
+    """Get the current time as an ISO string with one-second resolution."""
+    second = int(time.time())
+    if second != self.last_second:
+      self.last_second = second
+      self.last_timestamp = datetime.fromtimestamp(second).isoformat()
+    return self.last_timestamp
+
   def generate_world_data(self) -> Dict[str, Any]:
     """Generate mock world data."""
-    worlds = []
-    for i, world_name in enumerate(self.worlds[:random.randint(1, 3)]):
-      worlds.append({
-          "index": i,
-          "name": world_name,
-          "users": random.randint(0, 8),
-          "status": random.choice(["running", "starting", "idle"])
-      })
+    selected_worlds = self.worlds[:self._rng.randint(1, 3)]
+    user_counts = self._rng.choices(range(9), k=len(selected_worlds))
+    statuses = self._rng.choices(["running", "starting", "idle"], k=len(selected_worlds))
+    worlds = [
+        {
+            "index": i,
+            "name": world_name,
+            "users": users,
+            "status": status
+        }
+        for i, (world_name, users, status) in enumerate(zip(selected_worlds, user_counts, statuses))
+    ]
 
     return {
         "worlds": worlds,
@@ -97,79 +125,136 @@ class MockDataGenerator:
   def generate_status_data(self) -> Dict[str, Any]:
     """Generate mock status data."""
     return {
-        "status": random.choice(["running", "starting", "stopping"]),
-        "uptime": f"{random.randint(0, 48)}h {random.randint(0, 59)}m",
-        "memory_usage": f"{random.uniform(1.0, 4.0):.1f}GB",
-        "cpu_usage": f"{random.uniform(5.0, 50.0):.1f}%",
-        "container_id": f"resonite-{random.randint(1, 5)}"
+        "status": self._rng.choice(["running", "starting", "stopping"]),
+        "uptime": f"{self._rng.randint(0, 48)}h {self._rng.randint(0, 59)}m",
+        "memory_usage": f"{self._rng.uniform(1.0, 4.0):.1f}GB",
+        "cpu_usage": f"{self._rng.uniform(5.0, 50.0):.1f}%",
+        "container_id": f"resonite-{self._rng.randint(1, 5)}"
     }
 
   def generate_metrics_data(self) -> Dict[str, Any]:
     """Generate mock system metrics."""
     return {
-        "cpu_percent": random.uniform(10.0, 80.0),
-        "memory_percent": random.uniform(30.0, 90.0),
-        "disk_usage": random.uniform(20.0, 95.0),
-        "network_rx": random.randint(1000, 50000),
-        "network_tx": random.randint(500, 25000)
+        "cpu_percent": self._rng.uniform(10.0, 80.0),
+        "memory_percent": self._rng.uniform(30.0, 90.0),
+        "disk_usage": self._rng.uniform(20.0, 95.0),
+        "network_rx": self._rng.randint(1000, 50000),
+        "network_tx": self._rng.randint(500, 25000)
     }
 
 
 # Global mock data generator
 mock_data = MockDataGenerator()
 
+# Worker threads shared by the multi-threaded tests, shut down at the end of main()
+worker_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cache_test_worker")
 
-def test_basic_operations():
-  """Test basic cache operations (set, get, delete)."""
-  print("\n=== Basic Operations Test ===")
+# Cache keys used inside the test loops, built once rather than formatted on every iteration
+_ITEM_KEYS = tuple(f"item_{i}" for i in range(16))
+_THREAD_KEYS = {(t, i): f"thread_{t}_item_{i}" for t in range(8) for i in range(16)}
+_CONCURRENT_KEYS = tuple(f"concurrent_{i}" for i in range(5))
 
-  # Create a dedicated cache for this test
-  cache = CacheManager(default_ttl=60, max_entries=100)
+
+class FakeClock:
+  """
+  Manually advanced clock for CacheManager's time_func.
+
+  Lets TTL tests move time forward instantly instead of sleeping.
+  """
+
+  def __init__(self, start_ns: int = 0):
+    """Initialize the clock at the given time in nanoseconds."""
+    self.now_ns = start_ns
+
+  def __call__(self) -> int:
+    """Return the current fake time in nanoseconds."""
+    return self.now_ns
+
+  def tick(self, seconds: float) -> None:
+    """Advance the clock by the given number of seconds."""
+    self.now_ns += round(seconds * NS_PER_SECOND)
+
+
+class TestReporter:
+  """
+  Collects a test's progress output and writes it to stdout in one go.
+
+  Also keeps the output of tests that run concurrently from interleaving.
+  """
+
+  __test__ = False  # Helper class, not a pytest test case
+
+  def __init__(self, title: str):
+    """Start the report with the test's section header."""
+    self._buffer = io.StringIO()
+    self._buffer.write(f"\n=== {title} ===\n")
+
+  def ok(self, message: str) -> None:
+    """Record a passed check."""
+    self._buffer.write(f"✓ {message}\n")
+
+  def getvalue(self) -> str:
+    """Return everything recorded so far."""
+    return self._buffer.getvalue()
+
+  def flush(self) -> None:
+    """Write the recorded output to stdout."""
+    sys.stdout.write(self.getvalue())
+    sys.stdout.flush()
+
+
+def test_basic_operations(cache: CacheManager):
+  """Test basic cache operations (set, get, delete)."""
+  reporter = TestReporter("Basic Operations Test")
 
   try:
     # Test data storage
     user_data = mock_data.generate_user_data(3)
     success = cache.set("test_users", user_data, ttl=30, category="test_data")
     assert success, "Failed to store user data"
-    print("✓ Data storage successful")
+    reporter.ok("Data storage successful")
 
     # Test data retrieval
     entry = cache.get("test_users")
     assert entry is not None, "Failed to retrieve stored data"
     assert entry.data == user_data, "Retrieved data doesn't match stored data"
     assert entry.category == "test_data", "Category doesn't match"
-    print("✓ Data retrieval successful")
+    reporter.ok("Data retrieval successful")
 
     # Test data existence check
     assert cache.has_key("test_users"), "Key should exist"
     assert not cache.has_key("nonexistent"), "Nonexistent key should not exist"
-    print("✓ Key existence checks successful")
+    reporter.ok("Key existence checks successful")
 
     # Test convenience method
     retrieved_data = cache.get_data("test_users")
     assert retrieved_data == user_data, "Convenience method failed"
-    print("✓ Convenience method works")
+    reporter.ok("Convenience method works")
 
     # Test data deletion
     success = cache.delete("test_users")
     assert success, "Failed to delete data"
     assert not cache.has_key("test_users"), "Key should not exist after deletion"
-    print("✓ Data deletion successful")
+    reporter.ok("Data deletion successful")
 
     # Test invalid operations
     assert not cache.set("", {"data": "test"}), "Empty key should fail"
     assert not cache.set("key", lambda x: x), "Non-serializable data should fail"
-    print("✓ Invalid operations properly rejected")
+    reporter.ok("Invalid operations properly rejected")
 
   finally:
-    cache.shutdown()
+    # Leave the shared cache empty for the next test
+    cache.clear()
+    cache.reset_stats()
+    reporter.flush()
 
 
 def test_ttl_and_freshness():
   """Test TTL handling and data freshness."""
-  print("\n=== TTL and Freshness Test ===")
+  reporter = TestReporter("TTL and Freshness Test")
 
-  cache = CacheManager(default_ttl=2, cleanup_interval=1)  # Short TTL for testing
+  clock = FakeClock()
+  cache = CacheManager(default_ttl=2, cleanup_interval=1, time_func=clock)  # Short TTL for testing
 
   try:
     # Store data with short TTL
@@ -181,73 +266,75 @@ def test_ttl_and_freshness():
     assert entry is not None, "Fresh data should be available"
     assert entry.is_fresh(), "Data should be fresh"
     assert entry.status == CacheStatus.FRESH, "Status should be FRESH"
-    print("✓ Fresh data retrieval works")
+    reporter.ok("Fresh data retrieval works")
 
-    # Wait until stale
-    print("Waiting for data to become stale...")
-    time.sleep(2.5)
+    # Move past the TTL so the data becomes stale
+    clock.tick(2.5)
 
     # Check stale data
     entry = cache.get("fresh_test", include_stale=True)
     assert entry is not None, "Stale data should be available with include_stale=True"
     assert not entry.is_fresh(), "Data should not be fresh"
     assert entry.status == CacheStatus.STALE, "Status should be STALE"
-    print("✓ Stale data handling works")
+    reporter.ok("Stale data handling works")
 
     # Check fresh-only retrieval
     entry = cache.get("fresh_test", include_stale=False)
     assert entry is None, "Stale data should not be available with include_stale=False"
-    print("✓ Fresh-only retrieval works")
+    reporter.ok("Fresh-only retrieval works")
 
-    # Wait until expired
-    print("Waiting for data to expire...")
-    time.sleep(3)
+    # Move past twice the TTL so the data expires
+    clock.tick(3)
 
     # Check expired data
     entry = cache.get("fresh_test", include_stale=True)
     assert entry is None, "Expired data should not be available"
-    print("✓ Expired data handling works")
+    reporter.ok("Expired data handling works")
 
     # Test TTL calculations
     cache.set("ttl_test", {"data": "test"}, ttl=10)
     entry = cache.get("ttl_test")
     assert entry.get_remaining_ttl() > 8, "TTL calculation incorrect"
     assert entry.get_age_seconds() < 2, "Age calculation incorrect"
-    print("✓ TTL calculations work")
+    reporter.ok("TTL calculations work")
 
   finally:
     cache.shutdown()
+    reporter.flush()
 
 
 def test_categories():
   """Test category-based cache management."""
-  print("\n=== Categories Test ===")
+  reporter = TestReporter("Categories Test")
 
   cache = CacheManager(default_ttl=300)
 
   try:
     # Store data in different categories
-    cache.set("users", mock_data.generate_user_data(), category="resonite_data")
-    cache.set("worlds", mock_data.generate_world_data(), category="resonite_data")
-    cache.set("status", mock_data.generate_status_data(), category="container_info")
-    cache.set("metrics", mock_data.generate_metrics_data(), category="system_metrics")
-    cache.set("temp1", {"data": "temp"}, category="temp_data")
-    cache.set("temp2", {"data": "temp"}, category="temp_data")
+    stored = cache.set_many([
+        ("users", mock_data.generate_user_data(), {"category": "resonite_data"}),
+        ("worlds", mock_data.generate_world_data(), {"category": "resonite_data"}),
+        ("status", mock_data.generate_status_data(), {"category": "container_info"}),
+        ("metrics", mock_data.generate_metrics_data(), {"category": "system_metrics"}),
+        ("temp1", {"data": "temp"}, {"category": "temp_data"}),
+        ("temp2", {"data": "temp"}, {"category": "temp_data"}),
+    ])
+    assert stored == 6, f"Expected 6 entries stored, got {stored}"
 
     # Test category key listing
     resonite_keys = cache.get_keys(category="resonite_data")
     assert len(resonite_keys) == 2, f"Expected 2 resonite keys, got {len(resonite_keys)}"
     assert "users" in resonite_keys and "worlds" in resonite_keys, "Wrong resonite keys"
-    print("✓ Category key listing works")
+    reporter.ok("Category key listing works")
 
-    temp_keys = cache.get_keys(category="temp_data")
-    assert len(temp_keys) == 2, f"Expected 2 temp keys, got {len(temp_keys)}"
-    print("✓ Multiple entries per category work")
+    temp_count = cache.count(category="temp_data")
+    assert temp_count == 2, f"Expected 2 temp keys, got {temp_count}"
+    reporter.ok("Multiple entries per category work")
 
     # Test category entry retrieval
     resonite_entries = cache.get_all_entries(category="resonite_data")
     assert len(resonite_entries) == 2, "Wrong number of resonite entries"
-    print("✓ Category entry retrieval works")        # Test category invalidation
+    reporter.ok("Category entry retrieval works")        # Test category invalidation
     invalidated = cache.invalidate_category("resonite_data")
     assert invalidated == 2, f"Expected to invalidate 2 entries, got {invalidated}"
 
@@ -257,42 +344,41 @@ def test_categories():
 
     # Invalidated entries are considered expired, so they're not available even with include_stale=True
     # This is the correct behavior - invalidated data should not be used
-    print("✓ Category invalidation works")
+    reporter.ok("Category invalidation works")
 
     # Test category clearing
     cleared = cache.clear(category="temp_data")
     assert cleared == 2, f"Expected to clear 2 entries, got {cleared}"
-    assert len(cache.get_keys(category="temp_data")) == 0, "Temp category should be empty"
-    print("✓ Category clearing works")
+    assert cache.count(category="temp_data") == 0, "Temp category should be empty"
+    reporter.ok("Category clearing works")
 
     # Test that other categories are unaffected
     assert cache.get_data("status") is not None, "Other categories should be unaffected"
     assert cache.get_data("metrics") is not None, "Other categories should be unaffected"
-    print("✓ Category isolation works")
+    reporter.ok("Category isolation works")
 
   finally:
     cache.shutdown()
+    reporter.flush()
 
 
-def test_statistics():
+def test_statistics(cache: CacheManager):
   """Test cache statistics and monitoring."""
-  print("\n=== Statistics Test ===")
-
-  cache = CacheManager(default_ttl=60)
+  reporter = TestReporter("Statistics Test")
 
   try:
     # Add some data
-    for i in range(5):
-      cache.set(f"item_{i}", {"value": i}, category="test_stats")
+    payloads = [{"value": i} for i in range(5)]
+    for key, payload in zip(_ITEM_KEYS, payloads):
+      cache.set(key, payload, category="test_stats")
 
     # Access some entries multiple times
-    for _ in range(3):
-      cache.get_data("item_1")
-      cache.get_data("item_2")
+    found = cache.get_many(["item_1", "item_1", "item_1", "item_2", "item_2", "item_2"])
+    assert set(found) == {"item_1", "item_2"}, f"Expected item_1 and item_2, got {sorted(found)}"
 
     # Try to access non-existent data (cache misses)
-    cache.get_data("nonexistent_1")
-    cache.get_data("nonexistent_2")
+    missing = cache.get_many(["nonexistent_1", "nonexistent_2"])
+    assert missing == {}, f"Expected no data for missing keys, got {missing}"
 
     # Invalidate some entries
     cache.invalidate("item_3")
@@ -310,175 +396,201 @@ def test_statistics():
     assert stats.total_sets == 5, f"Expected 5 sets, got {stats.total_sets}"
     assert stats.total_invalidations == 2, f"Expected 2 invalidations, got {stats.total_invalidations}"
 
-    print(f"✓ Statistics tracking works (Hit rate: {stats.get_hit_rate():.1f}%)")
+    reporter.ok(f"Statistics tracking works (Hit rate: {stats.get_hit_rate():.1f}%)")
 
     # Test category statistics
     assert "test_stats" in stats.categories, "Category should be in stats"
     assert stats.categories["test_stats"] == 5, "Category count should be 5"
-    print("✓ Category statistics work")
+    reporter.ok("Category statistics work")
 
     # Test statistics serialization
+    import json  # pylint: disable=import-outside-toplevel
     stats_dict = stats.to_dict()
     assert isinstance(stats_dict, dict), "Stats should convert to dict"
     assert "hit_rate_percent" in stats_dict, "Hit rate should be in dict"
-    json_str = json.dumps(stats_dict, indent=2)
+    json_str = json.dumps(stats_dict, separators=(",", ":"))
     assert len(json_str) > 100, "JSON should be substantial"
-    print("✓ Statistics serialization works")
+    reporter.ok("Statistics serialization works")
 
   finally:
-    cache.shutdown()
+    # Leave the shared cache empty for the next test
+    cache.clear()
+    cache.reset_stats()
+    reporter.flush()
 
 
 def test_cleanup_and_memory():
   """Test cleanup and memory management."""
-  print("\n=== Cleanup and Memory Test ===")
+  reporter = TestReporter("Cleanup and Memory Test")
 
   # Create cache with small limits for testing
-  cache = CacheManager(default_ttl=1, max_entries=3, cleanup_interval=0.5)
+  clock = FakeClock()
+  cache = CacheManager(default_ttl=1, max_entries=3, cleanup_interval=0.5, time_func=clock)
 
   try:
-    # Fill beyond capacity
-    for i in range(5):
-      cache.set(f"item_{i}", {"value": i})
-      time.sleep(0.1)  # Small delay for different timestamps
+    # Fill beyond capacity, advancing the clock so each entry has a distinct age
+    payloads = [{"value": i} for i in range(5)]
+    for key, payload in zip(_ITEM_KEYS, payloads):
+      cache.set(key, payload)
+      clock.tick(0.1)
 
     stats = cache.get_stats()
     assert stats.total_entries <= 3, f"Cache should have max 3 entries, has {stats.total_entries}"
-    print("✓ Maximum entries limit enforced")
+    reporter.ok("Maximum entries limit enforced")
 
     # Check which items remain (should be most recent)
     remaining_keys = cache.get_keys()
     assert len(remaining_keys) <= 3, "Should have at most 3 keys"
-    print(f"✓ LRU eviction works (remaining keys: {remaining_keys})")
+    reporter.ok(f"LRU eviction works (remaining keys: {remaining_keys})")
 
-    # Wait for data to expire
-    print("Waiting for data to expire...")
-    time.sleep(2.5)
+    # Move past twice the TTL so the data expires
+    clock.tick(2.5)
 
     # Manual cleanup
     cleaned = cache.cleanup()
-    print(f"✓ Manual cleanup removed {cleaned} entries")
+    reporter.ok(f"Manual cleanup removed {cleaned} entries")
 
     # Check final state
     final_stats = cache.get_stats()
     assert final_stats.total_entries == 0, "All entries should be cleaned up"
-    print("✓ All expired entries cleaned up")
+    reporter.ok("All expired entries cleaned up")
 
-    # Test automatic cleanup (add data and wait)
+    # Test automatic cleanup (add data, expire it and give the cleanup thread a chance to run)
     cache.set("auto_cleanup", {"test": "data"}, ttl=1)
-    time.sleep(2)  # Wait for automatic cleanup
+    clock.tick(2.5)
+    time.sleep(cache.cleanup_interval * 2)
 
     # The cleanup thread should have removed the expired entry
+    assert "auto_cleanup" not in cache.get_keys(), "Automatic cleanup should have worked"
     assert cache.get_data("auto_cleanup") is None, "Automatic cleanup should have worked"
-    print("✓ Automatic cleanup works")
+    reporter.ok("Automatic cleanup works")
 
   finally:
     cache.shutdown()
+    reporter.flush()
 
 
-def _perform_cache_operations(cache, thread_id: int, operation_count: int, results: list):
-  """Perform cache operations for a single thread."""
-  for i in range(operation_count):
-    key = f"thread_{thread_id}_item_{i}"
-    data = {
-        "thread_id": thread_id,
-        "item_id": i,
-        "timestamp": time.time(),
-        "data": f"test_data_{thread_id}_{i}"
-    }
+def _build_thread_payloads(thread_id: int, operation_count: int) -> list:
+  """Build the data a worker thread will store, ahead of the timed section."""
+  return [
+      {
+          "thread_id": thread_id,
+          "item_id": i,
+          "timestamp": time.time(),
+          "data": f"test_data_{thread_id}_{i}"
+      }
+      for i in range(operation_count)
+  ]
+
+
+def _perform_cache_operations(cache, thread_id: int, payloads: list, result_counts: list,
+                              barrier: threading.Barrier):
+  """
+  Perform cache operations for a single thread.
+
+  Completed operations are counted locally and the total is stored in this
+  thread's own slot of result_counts, so no two workers share a slot.
+  """
+  category = f"thread_{thread_id}"
+  completed = 0
+
+  # Start every worker at the same moment so their operations actually contend
+  barrier.wait()
+
+  for i, data in enumerate(payloads):
+    key = _THREAD_KEYS[(thread_id, i)]
 
     # Store data
-    success = cache.set(key, data, category=f"thread_{thread_id}")
+    success = cache.set(key, data, category=category)
     if success:
-      results.append(f"SET:{thread_id}:{i}")
+      completed += 1
 
     # Retrieve data
     retrieved = cache.get_data(key)
     if retrieved and retrieved["thread_id"] == thread_id:
-      results.append(f"GET:{thread_id}:{i}")
+      completed += 1
 
-    # Small random delay
-    time.sleep(random.uniform(0.001, 0.005))
+  result_counts[thread_id] = completed
 
 
-def _create_worker_thread(cache, thread_id: int, operation_count: int, results: list, errors: list):
-  """Create a worker thread that performs cache operations."""
-  def worker_thread():
-    """Worker thread that performs cache operations."""
-    try:
-      _perform_cache_operations(cache, thread_id, operation_count, results)
-    except (ValueError, TypeError, KeyError, RuntimeError) as e:
-      errors.append(f"Thread {thread_id}: {str(e)}")
-    except Exception as e:  # pylint: disable=broad-exception-caught
-      # In thread safety tests, we need to catch all exceptions to avoid breaking the test
-      errors.append(f"Thread {thread_id}: Unexpected error: {str(e)}")
-
-  return threading.Thread(target=worker_thread)
+def _cache_worker(cache, thread_id: int, payloads: list, result_counts: list, errors: list,
+                  barrier: threading.Barrier):
+  """Worker task that performs cache operations, recording any error instead of raising it."""
+  try:
+    _perform_cache_operations(cache, thread_id, payloads, result_counts, barrier)
+  except (ValueError, TypeError, KeyError, RuntimeError) as e:
+    errors.append(f"Thread {thread_id}: {str(e)}")
+  except Exception as e:  # pylint: disable=broad-exception-caught
+    # In thread safety tests, we need to catch all exceptions to avoid breaking the test
+    errors.append(f"Thread {thread_id}: Unexpected error: {str(e)}")
 
 
-def _validate_thread_results(results: list, errors: list, thread_count: int, operations_per_thread: int, cache):
+def _validate_thread_results(result_counts: list, errors: list, thread_count: int, operations_per_thread: int, cache,
+                             reporter: TestReporter):
   """Validate the results of thread safety testing."""
   # Check for errors
   assert len(errors) == 0, f"Errors occurred: {errors}"
 
   # Check operation count
   expected_operations = thread_count * operations_per_thread * 2  # SET + GET
-  assert len(results) == expected_operations, f"Expected {expected_operations} operations, got {len(results)}"
+  total_operations = sum(result_counts)
+  assert total_operations == expected_operations, f"Expected {expected_operations} operations, got {total_operations}"
 
   # Check final cache state
   stats = cache.get_stats()
   assert stats.total_entries == thread_count * operations_per_thread, "Wrong number of entries"
   assert stats.total_sets == thread_count * operations_per_thread, "Wrong number of sets"
 
-  print(f"✓ Thread safety test passed ({len(results)} operations, {stats.total_entries} entries)")
+  reporter.ok(f"Thread safety test passed ({total_operations} operations, {stats.total_entries} entries)")
 
 
-def _validate_category_separation(cache, thread_count: int, operations_per_thread: int):
+def _validate_category_separation(cache, thread_count: int, operations_per_thread: int, reporter: TestReporter):
   """Validate that thread operations are properly separated by category."""
   for thread_id in range(thread_count):
-    category_keys = cache.get_keys(category=f"thread_{thread_id}")
-    assert len(category_keys) == operations_per_thread, f"Thread {thread_id} should have {operations_per_thread} keys"
+    category_count = cache.count(category=f"thread_{thread_id}")
+    assert category_count == operations_per_thread, f"Thread {thread_id} should have {operations_per_thread} keys"
 
-  print("✓ Thread-safe category operations work")
+  reporter.ok("Thread-safe category operations work")
 
 
-def test_thread_safety():
+def test_thread_safety(cache: CacheManager):
   """Test thread safety of cache operations."""
-  print("\n=== Thread Safety Test ===")
+  reporter = TestReporter("Thread Safety Test")
 
-  cache = CacheManager(default_ttl=60, max_entries=100)
-  results = []
   errors = []
 
   try:
     # Configuration
     thread_count = 5
     operations_per_thread = 10
+    result_counts = [0] * thread_count
 
-    # Create and start threads
-    threads = []
-    for thread_id in range(thread_count):
-      thread = _create_worker_thread(cache, thread_id, operations_per_thread, results, errors)
-      threads.append(thread)
-      thread.start()
+    # Build every thread's data up front and release the threads together
+    barrier = threading.Barrier(thread_count)
+    thread_payloads = [_build_thread_payloads(thread_id, operations_per_thread) for thread_id in range(thread_count)]
 
-    # Wait for completion
-    for thread in threads:
-      thread.join()
+    # Run the workers on the shared pool and wait for them all to finish
+    futures = [
+        worker_pool.submit(_cache_worker, cache, thread_id, thread_payloads[thread_id], result_counts, errors,
+                           barrier)
+        for thread_id in range(thread_count)
+    ]
+    wait(futures)
 
     # Validate results
-    _validate_thread_results(results, errors, thread_count, operations_per_thread, cache)
-    _validate_category_separation(cache, thread_count, operations_per_thread)
+    _validate_thread_results(result_counts, errors, thread_count, operations_per_thread, cache, reporter)
+    _validate_category_separation(cache, thread_count, operations_per_thread, reporter)
 
   finally:
-    cache.shutdown()
+    # Leave the shared cache empty for the next test
+    cache.clear()
+    cache.reset_stats()
+    reporter.flush()
 
 
-def test_resonite_integration():
+def test_resonite_integration(cache: CacheManager):
   """Test realistic Resonite integration scenarios."""
-  print("\n=== Resonite Integration Test ===")
-
-  cache = CacheManager(default_ttl=120)
+  reporter = TestReporter("Resonite Integration Test")
 
   try:
     # Simulate caching results from common Resonite commands
@@ -533,13 +645,13 @@ def test_resonite_integration():
     assert result["is_fresh"], "Data should be fresh"
     assert result["data"]["total_count"] == 4, "Should have 4 users"
     assert result["metadata"]["command"] == "users", "Metadata should be preserved"
-    print("✓ Cached data retrieval with metadata works")
+    reporter.ok("Cached data retrieval with metadata works")
 
     # Test cache warming scenario
     cache_keys = ["resonite_users", "resonite_worlds", "container_status"]
-    all_cached = all(cache.has_key(key) for key in cache_keys)
+    all_cached = cache.contains_all(cache_keys)
     assert all_cached, "All data should be cached"
-    print("✓ Cache warming scenario works")
+    reporter.ok("Cache warming scenario works")
 
     # Test bulk operations
     resonite_entries = cache.get_all_entries(category="resonite_data")
@@ -550,28 +662,33 @@ def test_resonite_integration():
     assert fresh_resonite is None, "Invalidated data should not be fresh"
     # Note: Invalidated entries are considered expired and not retrievable even with include_stale=True
     # This is correct behavior - invalidated data should not be used
-    print("✓ Category-based refresh works")
+    reporter.ok("Category-based refresh works")
 
     # Test that container info is unaffected
     container_data = cache.get("container_status")
     assert container_data is not None, "Container data should be unaffected"
     assert container_data.is_fresh(), "Container data should still be fresh"
-    print("✓ Category isolation during invalidation works")
+    reporter.ok("Category isolation during invalidation works")
 
   finally:
-    cache.shutdown()
+    # Leave the shared cache empty for the next test
+    cache.clear()
+    cache.reset_stats()
+    reporter.flush()
 
 
 async def test_async_compatibility():
   """Test async compatibility and usage patterns."""
-  print("\n=== Async Compatibility Test ===")
+  reporter = TestReporter("Async Compatibility Test")
+
+  import asyncio  # pylint: disable=import-outside-toplevel
 
   cache = CacheManager(default_ttl=60)
 
   try:
     # Simulate async data fetching and caching
-    async def fetch_and_cache_data(key: str, delay: float = 0.1):
-      await asyncio.sleep(delay)  # Simulate async operation
+    async def fetch_and_cache_data(key: str, delay: float = 0):
+      await asyncio.sleep(delay)  # Simulate async operation by yielding to the event loop
       data = mock_data.generate_user_data()
       cache.set(key, data, ttl=60, category="async_test")
       return data
@@ -595,17 +712,14 @@ async def test_async_compatibility():
     assert cached2, "Second call should be cached"
     assert data2 == data1, "Cached data should match"
 
-    print("✓ Async caching pattern works")
+    reporter.ok("Async caching pattern works")
 
     # Test concurrent async operations
     async def concurrent_test():
-      tasks = []
-      for i in range(5):
-        task = get_data_with_cache(f"concurrent_{i}")
-        tasks.append(task)
+      async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(get_data_with_cache(key)) for key in _CONCURRENT_KEYS]
 
-      results = await asyncio.gather(*tasks)
-      return results
+      return [task.result() for task in tasks]
 
     concurrent_results = await concurrent_test()
     assert len(concurrent_results) == 5, "Should have 5 results"
@@ -614,17 +728,16 @@ async def test_async_compatibility():
     cache_misses = sum(1 for _, cached in concurrent_results if not cached)
     assert cache_misses == 5, "All should be cache misses"
 
-    print("✓ Concurrent async operations work")
+    reporter.ok("Concurrent async operations work")
 
   finally:
     cache.shutdown()
+    reporter.flush()
 
 
-def test_error_handling():
+def test_error_handling(cache: CacheManager):
   """Test error handling and edge cases."""
-  print("\n=== Error Handling Test ===")
-
-  cache = CacheManager(default_ttl=60)
+  reporter = TestReporter("Error Handling Test")
 
   try:
     # Test invalid TTL
@@ -632,12 +745,12 @@ def test_error_handling():
       cache.set("invalid_ttl", {"data": "test"}, ttl=-1)
       assert False, "Should have raised ValueError for negative TTL"
     except ValueError:
-      print("✓ Negative TTL properly rejected")
+      reporter.ok("Negative TTL properly rejected")
 
     # Test empty/None keys
     assert not cache.set("", {"data": "test"}), "Empty key should fail"
     assert not cache.set(None, {"data": "test"}), "None key should fail"
-    print("✓ Invalid keys properly rejected")
+    reporter.ok("Invalid keys properly rejected")
 
     # Test non-serializable data
     class NonSerializable:
@@ -648,7 +761,7 @@ def test_error_handling():
 
     non_serializable = NonSerializable()
     assert not cache.set("bad_data", non_serializable), "Non-serializable data should fail"
-    print("✓ Non-serializable data properly rejected")
+    reporter.ok("Non-serializable data properly rejected")
 
     # Test operations on non-existent keys
     assert cache.get("nonexistent") is None, "Non-existent key should return None"
@@ -656,14 +769,14 @@ def test_error_handling():
     assert not cache.has_key("nonexistent"), "Non-existent key should not exist"
     assert not cache.delete("nonexistent"), "Deleting non-existent key should return False"
     assert not cache.invalidate("nonexistent"), "Invalidating non-existent key should return False"
-    print("✓ Operations on non-existent keys handled gracefully")
+    reporter.ok("Operations on non-existent keys handled gracefully")
 
     # Test empty category operations
-    assert len(cache.get_keys(category="empty_category")) == 0, "Empty category should have no keys"
+    assert cache.count(category="empty_category") == 0, "Empty category should have no keys"
     assert len(cache.get_all_entries(category="empty_category")) == 0, "Empty category should have no entries"
     assert cache.invalidate_category("empty_category") == 0, "Empty category invalidation should return 0"
     assert cache.clear(category="empty_category") == 0, "Empty category clear should return 0"
-    print("✓ Empty category operations handled gracefully")
+    reporter.ok("Empty category operations handled gracefully")
 
     # Test cache entry edge cases
     cache.set("edge_case", {"data": "test"}, ttl=1)
@@ -676,63 +789,90 @@ def test_error_handling():
     cache.get("edge_case")
     updated_entry = cache.get("edge_case")
     assert updated_entry.access_count > original_count, "Access count should increase"
-    print("✓ Access tracking works correctly")
+    reporter.ok("Access tracking works correctly")
 
   finally:
-    cache.shutdown()
+    # Leave the shared cache empty for the next test
+    cache.clear()
+    cache.reset_stats()
+    reporter.flush()
 
 
 def test_global_cache():
   """Test global cache instance management."""
-  print("\n=== Global Cache Test ===")
+  reporter = TestReporter("Global Cache Test")
 
-  # Clean up any existing global cache
-  cleanup_global_cache()
+  try:
+    # Clean up any existing global cache
+    cleanup_global_cache()
 
-  # Get global cache instances
-  cache1 = get_global_cache()
-  cache2 = get_global_cache()
+    # Get global cache instances
+    cache1 = get_global_cache()
+    cache2 = get_global_cache()
 
-  # Should be the same instance
-  assert cache1 is cache2, "Global cache should be singleton"
-  print("✓ Global cache singleton works")
+    # Should be the same instance
+    assert cache1 is cache2, "Global cache should be singleton"
+    reporter.ok("Global cache singleton works")
 
-  # Test global cache functionality
-  cache1.set("global_test", {"data": "test"}, category="global_test")
-  data = cache2.get_data("global_test")
-  assert data is not None, "Global cache should share data"
-  assert data["data"] == "test", "Global cache data should match"
-  print("✓ Global cache data sharing works")
+    # Test global cache functionality
+    cache1.set("global_test", {"data": "test"}, category="global_test")
+    data = cache2.get_data("global_test")
+    assert data is not None, "Global cache should share data"
+    assert data["data"] == "test", "Global cache data should match"
+    reporter.ok("Global cache data sharing works")
 
-  # Test cleanup
-  cleanup_global_cache()
+    # Test cleanup
+    cleanup_global_cache()
+
+    # Getting cache again should create new instance
+    cache3 = get_global_cache()
+    assert cache3 is not cache1, "New global cache should be different instance"
+    assert cache3.get_data("global_test") is None, "New global cache should not have old data"
+    reporter.ok("Global cache cleanup works")
 
-  # Getting cache again should create new instance
-  cache3 = get_global_cache()
-  assert cache3 is not cache1, "New global cache should be different instance"
-  assert cache3.get_data("global_test") is None, "New global cache should not have old data"
-  print("✓ Global cache cleanup works")
+    # Clean up
+    cleanup_global_cache()
+
+  finally:
+    reporter.flush()
 
-  # Clean up
-  cleanup_global_cache()
+
+def run_shared_cache_tests():
+  """
+  Run the tests that work with the default 60 second TTL on one shared cache.
+
+  They run one after another, each leaving the cache empty with reset statistics,
+  so a single cleanup thread is started and shut down for all of them.
+  """
+  cache = CacheManager(default_ttl=60, max_entries=100)
+
+  try:
+    for test in (test_basic_operations, test_statistics, test_thread_safety,
+                 test_resonite_integration, test_error_handling):
+      test(cache)
+  finally:
+    cache.shutdown()
 
 
 async def main():
   """Run all tests."""
+  import asyncio  # pylint: disable=import-outside-toplevel
+
   print("Cache Manager Comprehensive Test Suite")
   print("=" * 60)
 
   try:
-    # Run all tests
-    test_basic_operations()
-    test_ttl_and_freshness()
-    test_categories()
-    test_statistics()
-    test_cleanup_and_memory()
-    test_thread_safety()
-    test_resonite_integration()
-    await test_async_compatibility()
-    test_error_handling()
+    # Each of these works on its own CacheManager, so run them concurrently to overlap
+    # the time they spend sleeping through TTLs and cleanup thread shutdowns
+    await asyncio.gather(
+        asyncio.to_thread(run_shared_cache_tests),
+        asyncio.to_thread(test_ttl_and_freshness),
+        asyncio.to_thread(test_categories),
+        asyncio.to_thread(test_cleanup_and_memory),
+        test_async_compatibility(),
+    )
+
+    # The global cache is shared module state, so test it on its own afterwards
     test_global_cache()
 
     print("\n" + "=" * 60)
@@ -742,13 +882,16 @@ async def main():
   except Exception as e:  # pylint: disable=broad-exception-caught
     # Top-level test runner needs to catch all exceptions to provide useful error reporting
     print(f"\n❌ Test failed: {str(e)}")
+    import traceback  # pylint: disable=import-outside-toplevel
     traceback.print_exc()
     sys.exit(1)
 
   finally:
     # Final cleanup
+    worker_pool.shutdown(wait=True)
     cleanup_global_cache()
 
 
 if __name__ == "__main__":
+  import asyncio
   asyncio.run(main())
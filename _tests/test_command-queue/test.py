@@ -8,29 +8,45 @@ various scenarios without requiring external dependencies.
 """
 
 import asyncio
+import importlib.util
 import logging
 import random
 import time
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Deque, Dict, Set
 
-# Add the parent directories to the path to import modules
+# Load the command queue module straight from the project tree rather than adding its folder to sys.path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root / "command_queue"))
+
+
+def _load_command_queue():
+  """
+  Import command_queue/command_queue.py by file path.
+
+  It is registered under a private name, so it does not shadow the project's command_queue package.
+  """
+  spec = importlib.util.spec_from_file_location("_command_queue_under_test",
+                                                project_root / "command_queue" / "command_queue.py")
+  module = importlib.util.module_from_spec(spec)
+  sys.modules[spec.name] = module
+  spec.loader.exec_module(module)
+  return module
+
 
 try:
-  from command_queue import (  # pylint: disable=import-error
-      Command,
-      CommandBlock,
-      CommandQueue,
-      Priority
-  )
-except ImportError as e:
+  _command_queue = _load_command_queue()
+except (ImportError, OSError) as e:
   print(f"Import error: {e}")
   print("Make sure you're running this script from the correct directory")
   sys.exit(1)
 
+Command = _command_queue.Command
+CommandBlock = _command_queue.CommandBlock
+CommandQueue = _command_queue.CommandQueue
+Priority = _command_queue.Priority
+
 
 # Configure logging
 logging.basicConfig(
@@ -44,6 +60,88 @@ logger = logging.getLogger(__name__)
 FOCUS_WORLD_1 = "focus 1"
 FOCUS_WORLD_0 = "focus 0"
 
+# Commands shared by the examples; the queue only reads them, so the same objects can be reused
+CMD_STATUS = Command("status", timeout=10)
+CMD_USERS = Command("users", timeout=15)
+CMD_WORLDS = Command("worlds")
+CMD_FOCUS_1 = Command(FOCUS_WORLD_1, timeout=10)
+CMD_FOCUS_0 = Command(FOCUS_WORLD_0, timeout=10)
+CMD_LISTBANS = Command("listbans", timeout=10)
+CMD_GC = Command("gc")
+CMD_FAIL = Command("fail_command")
+
+# Command blocks run by the examples, shared the same way as the commands above
+_WORLD1_INFO_BLOCK = CommandBlock((CMD_FOCUS_1, CMD_USERS, CMD_STATUS), description="Get detailed world 1 information")
+_ADMIN_BLOCK = CommandBlock((CMD_LISTBANS, CMD_STATUS), description="Administrative status check")
+_WORLD1_USERS_BLOCK = CommandBlock((CMD_FOCUS_1, CMD_USERS), description="Get world 1 info")
+_FAILING_BLOCK = CommandBlock(
+    (
+        CMD_STATUS,
+        CMD_FAIL,  # This will fail
+        CMD_WORLDS  # This won't execute due to block failure
+    ),
+    description="Block with failure"
+)
+
+# Users the mock "users" command picks from
+MOCK_USERS = ("TestUser1", "TestUser2", "TestUser3", "AdminBot")
+
+
+# Templates for the generated mock responses
+_STATUS_TEMPLATE = "Container: %s\nStatus: Running\nUsers: %d\nUptime: 02:30:15"
+_WORLDS_TEMPLATE = "World 0: Main Hall (%d users)\nWorld 1: Workshop (%d users)"
+_FOCUS_TEMPLATE = "Focused on world %s"
+_BAN_TEMPLATE = "User '%s' has been banned"
+
+
+def _status_response(rng, container_name: str, _argument: str) -> str:
+  """Build a mock container status report."""
+  return _STATUS_TEMPLATE % (container_name, rng.randint(1, 10))
+
+
+def _users_response(rng, _container_name: str, _argument: str) -> str:
+  """Build a mock list of active users."""
+  # One random bit per user picks a non-empty subset with a single draw
+  mask = rng.getrandbits(len(MOCK_USERS)) or 1
+  return "\n".join(f"User: {user} (Active)" for i, user in enumerate(MOCK_USERS) if mask >> i & 1)
+
+
+def _worlds_response(rng, _container_name: str, _argument: str) -> str:
+  """Build a mock list of running worlds."""
+  return _WORLDS_TEMPLATE % (rng.randint(0, 5), rng.randint(0, 3))
+
+
+def _focus_response(_rng, _container_name: str, argument: str) -> str:
+  """Build the reply to focusing a world."""
+  return _FOCUS_TEMPLATE % (argument or "0")
+
+
+def _ban_response(_rng, _container_name: str, argument: str) -> str:
+  """Build the reply to banning a user."""
+  return _BAN_TEMPLATE % (argument or "user")
+
+
+# Replies to commands whose output never changes, returned as-is
+_CONST_RESPONSES: Dict[str, str] = {
+    "shutdown": "Shutdown initiated successfully",
+    "restart": "Restart completed successfully",
+    "listbans": "Banned users:\n- troublemaker123\n- spammer456",
+    "gc": "Garbage collection completed",
+    "debugworldstate": "World debug info:\nWorld 0: 1024MB memory\nWorld 1: 512MB memory",
+}
+
+# Mock response builders, called as handler(rng, container_name, last_argument_word).
+# _RESPONSES covers commands given without arguments, _ARGUMENT_RESPONSES those that may take one.
+_RESPONSES: Dict[str, Callable[..., str]] = {
+    "status": _status_response,
+    "users": _users_response,
+    "worlds": _worlds_response,
+}
+_ARGUMENT_RESPONSES: Dict[str, Callable[..., str]] = {
+    "focus": _focus_response,
+    "ban": _ban_response,
+}
+
 
 class MockCommandExecutor:
   """
@@ -53,6 +151,12 @@ class MockCommandExecutor:
   successes, failures, timeouts, and variable execution times.
   """
 
+  __slots__ = ("base_delay", "failure_rate", "execution_count", "failed_commands", "command_history",
+               "_unique_commands", "_rng")
+
+  # Number of most recent commands kept in command_history
+  HISTORY_LIMIT = 1024
+
   def __init__(self, base_delay: float = 0.1, failure_rate: float = 0.0):
     """
     Initialize the mock executor.
@@ -65,7 +169,10 @@ class MockCommandExecutor:
     self.failure_rate = failure_rate
     self.execution_count = 0
     self.failed_commands: Dict[str, str] = {}
-    self.command_history: List[str] = []
+    self.command_history: Deque[str] = deque(maxlen=self.HISTORY_LIMIT)
+    self._unique_commands: Set[str] = set()
+    # Private generator so executors do not share the module-level random state
+    self._rng = random.Random()
 
   def add_failing_command(self, command: str, error_message: str = "Mock failure"):
     """Mark a specific command to always fail."""
@@ -75,6 +182,25 @@ class MockCommandExecutor:
     """
     Mock command execution with configurable behavior.
 
+    A blocking shim around execute_command_async for the queue's worker thread, which only calls sync executors.
+
+    Args:
+        container_name: Name of the container
+        command: Command to execute
+        timeout: Timeout in seconds
+
+    Returns:
+        str: Mock command output
+
+    Raises:
+        Various exceptions based on command and configuration
+    """
+    return asyncio.run(self.execute_command_async(container_name, command, timeout))
+
+  async def execute_command_async(self, container_name: str, command: str, timeout: int) -> str:
+    """
+    Async mock command execution that waits with asyncio.sleep instead of blocking.
+
     Args:
         container_name: Name of the container
         command: Command to execute
@@ -86,198 +212,129 @@ class MockCommandExecutor:
     Raises:
         Various exceptions based on command and configuration
     """
+    execution_time = self._start_execution(container_name, command, timeout)
+    await asyncio.sleep(execution_time)
+
+    # Return different responses based on command
+    return self._generate_mock_response(command, container_name)
+
+  def _start_execution(self, container_name: str, command: str, timeout: int) -> float:
+    """Record an execution, raise any configured failure and return the simulated execution time."""
     self.execution_count += 1
     self.command_history.append(command)
+    self._unique_commands.add(command)
 
-    logger.info("Mock executing '%s' on container '%s' (timeout: %ds, execution #%d)",
-                command, container_name, timeout, self.execution_count)
+    if logger.isEnabledFor(logging.INFO):
+      logger.info("Mock executing '%s' on container '%s' (timeout: %ds, execution #%d)",
+                  command, container_name, timeout, self.execution_count)
 
     # Check for specifically failing commands
     if command in self.failed_commands:
       raise RuntimeError(self.failed_commands[command])
 
     # Random failures based on failure rate
-    if self.failure_rate > 0 and random.random() < self.failure_rate:
+    if self.failure_rate > 0 and self._rng.random() < self.failure_rate:
       raise ConnectionError(f"Random failure for command: {command}")
 
     # Simulate execution time
-    execution_time = self.base_delay + random.uniform(0, self.base_delay)
-    time.sleep(execution_time)
-
-    # Return different responses based on command
-    return self._generate_mock_response(command, container_name)
+    return self.base_delay + self._rng.uniform(0, self.base_delay)
 
   def _generate_mock_response(self, command: str, container_name: str) -> str:
     """Generate realistic mock responses for different commands."""
-    command_lower = command.lower().strip()
-
-    if command_lower == "status":
-      return (f"Container: {container_name}\nStatus: Running\n"
-              f"Users: {random.randint(1, 10)}\nUptime: 02:30:15")
-    elif command_lower == "users":
-      users = ["TestUser1", "TestUser2", "TestUser3", "AdminBot"]
-      selected_users = random.sample(users, random.randint(1, len(users)))
-      return "\n".join(f"User: {user} (Active)" for user in selected_users)
-    elif command_lower == "worlds":
-      world_info = (f"World 0: Main Hall ({random.randint(0, 5)} users)\n"
-                    f"World 1: Workshop ({random.randint(0, 3)} users)")
-      return world_info
-    elif command_lower.startswith("focus"):
-      world_num = command_lower.split()[-1] if len(command_lower.split()) > 1 else "0"
-      return f"Focused on world {world_num}"
-    elif command_lower == "shutdown":
-      return "Shutdown initiated successfully"
-    elif command_lower == "restart":
-      return "Restart completed successfully"
-    elif command_lower.startswith("ban"):
-      username = command_lower.split()[-1] if len(command_lower.split()) > 1 else "user"
-      return f"User '{username}' has been banned"
-    elif command_lower == "listbans":
-      return "Banned users:\n- troublemaker123\n- spammer456"
-    elif command_lower == "gc":
-      return "Garbage collection completed"
-    elif command_lower == "debugworldstate":
-      return "World debug info:\nWorld 0: 1024MB memory\nWorld 1: 512MB memory"
-    else:
-      return f"Command '{command}' executed successfully (execution #{self.execution_count})"
+    verb, _, argument = command.lower().strip().partition(" ")
+
+    # Commands without an argument: constant replies first, then generated ones
+    if not argument:
+      response = _CONST_RESPONSES.get(verb)
+      if response is not None:
+        return response
+      handler = _RESPONSES.get(verb)
+      if handler is not None:
+        return handler(self._rng, container_name, "")
+
+    # focus and ban only look at the last word of their argument
+    handler = _ARGUMENT_RESPONSES.get(verb)
+    if handler is not None:
+      return handler(self._rng, container_name, argument.rpartition(" ")[2])
+
+    return f"Command '{command}' executed successfully (execution #{self.execution_count})"
 
   def get_stats(self) -> Dict[str, int]:
     """Get execution statistics."""
     return {
         'total_executions': self.execution_count,
-        'unique_commands': len(set(self.command_history)),
+        'unique_commands': len(self._unique_commands),
         'command_history_length': len(self.command_history)
     }
 
 
-# Create a global mock executor instance for use in examples
-mock_executor = MockCommandExecutor(base_delay=0.2)
-
-
-async def basic_usage_example():
+async def basic_usage_example(queue: CommandQueue):
   """Demonstrate basic command queue usage."""
   print("\n=== Basic Usage Example ===")
 
-  # Create command queue directly
-  queue = CommandQueue(
-      container_name="resonite-headless",
-      command_executor=mock_executor.execute_command
-  )
-
-  try:
-    # Execute single command
-    print("1. Executing single command...")
-    result = queue.add_command("status")
-    execution_result = await result.wait_for_completion()
-    print(f"Result: {execution_result.output}")
-
-    # Execute command with high priority
-    print("\n2. Executing high priority command...")
-    result = queue.add_command("shutdown", priority=Priority.HIGH)
-    execution_result = await result.wait_for_completion()
-    print(f"High priority result: {execution_result.output}")
+  # Queue everything up front so the queue works through it while we wait
+  print("1. Queueing single command, high priority command and command block...")
+  command_block = CommandBlock((
+      CMD_FOCUS_1,
+      CMD_USERS
+  ), description="Get users in world 1")
 
-    # Execute command block
-    print("\n3. Executing command block...")
-    command_block = CommandBlock([
-        Command("focus 1", timeout=10),
-        Command("users", timeout=15)
-    ], description="Get users in world 1")
+  status_result = queue.add_command("status")
+  shutdown_result = queue.add_command("shutdown", priority=Priority.HIGH)
+  block_result = queue.add_command_block(command_block)
 
-    result = queue.add_command_block(command_block)
-    execution_result = await result.wait_for_completion()
-    print(f"Block result: {execution_result.output}")
+  async with asyncio.TaskGroup() as tg:
+    status_task = tg.create_task(status_result.wait_for_completion())
+    shutdown_task = tg.create_task(shutdown_result.wait_for_completion())
+    block_task = tg.create_task(block_result.wait_for_completion())
 
-  finally:
-    queue.shutdown()
+  print(f"Result: {status_task.result().output}")
+  print(f"High priority result: {shutdown_task.result().output}")
+  print(f"Block result: {block_task.result().output}")
 
 
-async def command_block_example():
+async def command_block_example(queue: CommandQueue):
   """Demonstrate command block usage."""
   print("\n=== Command Block Example ===")
 
-  queue = CommandQueue(
-      container_name="resonite-headless",
-      command_executor=mock_executor.execute_command
-  )
-
-  try:
-    # Create a command block manually
-    print("1. Creating and executing command block...")
-    commands = [
-        Command(FOCUS_WORLD_1, timeout=10),
-        Command("users", timeout=15),
-        Command("status", timeout=10)
-    ]
-
-    command_block = CommandBlock(
-        commands=commands,
-        description="Get detailed world 1 information"
-    )
-
-    result = queue.add_command_block(command_block)
-    execution_result = await result.wait_for_completion()
-    print(f"Block result: {execution_result.output}")
-
-    # Create another command block for administration
-    print("\n2. Creating administrative command block...")
-    admin_commands = [
-        Command("listbans", timeout=10),
-        Command("status", timeout=10)
-    ]
-
-    admin_block = CommandBlock(
-        commands=admin_commands,
-        description="Administrative status check"
-    )
-
-    result = queue.add_command_block(admin_block, priority=Priority.HIGH)
-    execution_result = await result.wait_for_completion()
-    print(f"Admin block result: {execution_result.output}")
+  # Run a command block
+  print("1. Executing command block...")
+  result = queue.add_command_block(_WORLD1_INFO_BLOCK)
+  execution_result = await result.wait_for_completion()
+  print(f"Block result: {execution_result.output}")
 
-  finally:
-    queue.shutdown()
+  # Run another command block for administration
+  print("\n2. Executing administrative command block...")
+  result = queue.add_command_block(_ADMIN_BLOCK, priority=Priority.HIGH)
+  execution_result = await result.wait_for_completion()
+  print(f"Admin block result: {execution_result.output}")
 
 
-async def queue_status_example():
+async def queue_status_example(queue: CommandQueue):
   """Demonstrate queue status monitoring."""
   print("\n=== Queue Status Example ===")
 
-  queue = CommandQueue(
-      container_name="resonite-headless",
-      command_executor=mock_executor.execute_command
-  )
+  # Add several commands without waiting
+  print("1. Adding commands to queue...")
 
-  try:
-    # Add several commands without waiting
-    print("1. Adding commands to queue...")
-
-    # Add commands with different priorities
-    queue.add_command("status", priority=Priority.LOW)
-    queue.add_command("worlds", priority=Priority.NORMAL)
-    commands = [
-        Command(FOCUS_WORLD_1, timeout=10),
-        Command("users", timeout=15)
-    ]
-    world_block = CommandBlock(commands=commands, description="Get world 1 info")
-    queue.add_command_block(world_block, priority=Priority.NORMAL)
-
-    # Check status
-    status = queue.get_status()
-    print(f"Queue length: {status['queue_length']}")
-    print(f"Is processing: {status['is_processing']}")
-    print(f"Completed count: {status['completed_count']}")
-
-    # Wait a bit for processing
-    await asyncio.sleep(3)
-
-    # Check status again
-    status = queue.get_status()
-    print(f"\nAfter processing - Queue length: {status['queue_length']}")
-    print(f"Completed items: {status['completed_count']}")
+  # Add commands with different priorities
+  queue.add_command("status", priority=Priority.LOW)
+  queue.add_command("worlds", priority=Priority.NORMAL)
+  queue.add_command_block(_WORLD1_USERS_BLOCK, priority=Priority.NORMAL)
 
-  finally:
-    queue.shutdown()
+  # Check status
+  status = queue.get_status()
+  print(f"Queue length: {status['queue_length']}")
+  print(f"Is processing: {status['is_processing']}")
+  print(f"Completed count: {status['completed_count']}")
+
+  # Wait a bit for processing
+  await asyncio.sleep(3)
+
+  # Check status again
+  status = queue.get_status()
+  print(f"\nAfter processing - Queue length: {status['queue_length']}")
+  print(f"Completed items: {status['completed_count']}")
 
 
 def create_custom_command_blocks():
@@ -285,35 +342,35 @@ def create_custom_command_blocks():
   print("\n=== Custom Command Blocks Example ===")
 
   world_management = CommandBlock(
-      commands=[
-          Command(FOCUS_WORLD_1),
-          Command("status"),
-          Command("users"),
-          Command("worlds"),
-          Command("listbans")
-      ],
+      commands=(
+          CMD_FOCUS_1,
+          CMD_STATUS,
+          CMD_USERS,
+          CMD_WORLDS,
+          CMD_LISTBANS
+      ),
       description="Complete world 1 management info"
   )
 
   # Create a user investigation block
   user_investigation = CommandBlock(
-      commands=[
-          Command("worlds"),  # See all worlds first
-          Command("focus 0"),  # Focus on main world
-          Command("users"),   # Get user list
-          Command("listbans")  # Check ban list
-      ],
+      commands=(
+          CMD_WORLDS,  # See all worlds first
+          CMD_FOCUS_0,  # Focus on main world
+          CMD_USERS,  # Get user list
+          CMD_LISTBANS  # Check ban list
+      ),
       description="User investigation sequence"
   )
 
   # Create server maintenance block
   maintenance_block = CommandBlock(
-      commands=[
-          Command("status"),
-          Command("worlds"),
-          Command("listbans"),
-          Command("gc")
-      ],
+      commands=(
+          CMD_STATUS,
+          CMD_WORLDS,
+          CMD_LISTBANS,
+          CMD_GC
+      ),
       description="Server maintenance check"
   )
 
@@ -325,7 +382,7 @@ def create_custom_command_blocks():
   return [world_management, user_investigation, maintenance_block]
 
 
-async def error_handling_example():
+async def error_handling_example(queue: CommandQueue):
   """Demonstrate error handling capabilities."""
   print("\n=== Error Handling Example ===")
 
@@ -333,10 +390,9 @@ async def error_handling_example():
   failing_executor = MockCommandExecutor(base_delay=0.1)
   failing_executor.add_failing_command("fail_command", "Container not responding")
 
-  queue = CommandQueue(
-      container_name="resonite-headless",
-      command_executor=failing_executor.execute_command
-  )
+  # Run this example's commands through its own executor, restoring the shared one afterwards
+  previous_executor = queue.command_executor
+  queue.command_executor = failing_executor.execute_command
 
   try:
     # Test command that fails
@@ -353,61 +409,44 @@ async def error_handling_example():
 
     # Test command block with failure
     print("\n3. Testing command block with failure...")
-    commands = [
-        Command("status"),
-        Command("fail_command"),  # This will fail
-        Command("worlds")         # This won't execute due to block failure
-    ]
-    command_block = CommandBlock(commands=commands, description="Block with failure")
-    result = queue.add_command_block(command_block)
+    result = queue.add_command_block(_FAILING_BLOCK)
     execution_result = await result.wait_for_completion()
     print(f"Block with failure: Success={execution_result.success}, Error={execution_result.error}")
 
   finally:
-    queue.shutdown()
+    queue.command_executor = previous_executor
 
 
-async def priority_handling_example():
+async def priority_handling_example(queue: CommandQueue):
   """Demonstrate priority handling in the queue."""
   print("\n=== Priority Handling Example ===")
 
-  queue = CommandQueue(
-      container_name="resonite-headless",
-      command_executor=mock_executor.execute_command
-  )
+  # Add commands with different priorities (note: they'll be processed in priority order)
+  print("1. Adding commands with different priorities...")
 
-  try:
-    # Add commands with different priorities (note: they'll be processed in priority order)
-    print("1. Adding commands with different priorities...")
+  low_result = queue.add_command("status", priority=Priority.LOW)
+  normal_result = queue.add_command("users", priority=Priority.NORMAL)
+  high_result = queue.add_command("worlds", priority=Priority.HIGH)
 
-    low_result = queue.add_command("status", priority=Priority.LOW)
-    normal_result = queue.add_command("users", priority=Priority.NORMAL)
-    high_result = queue.add_command("worlds", priority=Priority.HIGH)
+  # Wait for all to complete
+  async with asyncio.TaskGroup() as tg:
+    tg.create_task(low_result.wait_for_completion())
+    tg.create_task(normal_result.wait_for_completion())
+    tg.create_task(high_result.wait_for_completion())
 
-    # Wait for all to complete
-    await asyncio.gather(
-        low_result.wait_for_completion(),
-        normal_result.wait_for_completion(),
-        high_result.wait_for_completion()
-    )
-
-    print("All priority commands completed")
-
-  finally:
-    queue.shutdown()
+  print("All priority commands completed")
 
 
-async def performance_example():
+async def performance_example(queue: CommandQueue):
   """Demonstrate performance characteristics."""
   print("\n=== Performance Example ===")
 
   # Create a fast executor for performance testing
   fast_executor = MockCommandExecutor(base_delay=0.01)
 
-  queue = CommandQueue(
-      container_name="resonite-headless",
-      command_executor=fast_executor.execute_command
-  )
+  # Run this example's commands through its own executor, restoring the shared one afterwards
+  previous_executor = queue.command_executor
+  queue.command_executor = fast_executor.execute_command
 
   try:
     print("1. Testing multiple simultaneous commands...")
@@ -427,7 +466,7 @@ async def performance_example():
     print(f"Executor stats: {fast_executor.get_stats()}")
 
   finally:
-    queue.shutdown()
+    queue.command_executor = previous_executor
 
 
 async def main():
@@ -435,14 +474,37 @@ async def main():
   print("Command Queue System Comprehensive Test")
   print("=" * 50)
 
-  # Run all examples
-  await basic_usage_example()
-  await command_block_example()
-  await queue_status_example()
-  create_custom_command_blocks()
-  await error_handling_example()
-  await priority_handling_example()
-  await performance_example()
+  mock_executor = MockCommandExecutor(base_delay=0.2)
+
+  # One queue serves the examples that run one after another, so its worker threads are only started and stopped once
+  queue = CommandQueue(
+      container_name="resonite-headless",
+      command_executor=mock_executor.execute_command
+  )
+
+  # The status, priority and performance examples don't depend on each other, so each gets its own queue
+  status_queue, priority_queue, performance_queue = (
+      CommandQueue(container_name="resonite-headless", command_executor=mock_executor.execute_command)
+      for _ in range(3)
+  )
+
+  try:
+    # Run the examples whose output order matters one at a time
+    await basic_usage_example(queue)
+    await command_block_example(queue)
+    create_custom_command_blocks()
+    await error_handling_example(queue)
+
+    # Then run the independent ones concurrently (their output is interleaved)
+    await asyncio.gather(
+        queue_status_example(status_queue),
+        priority_handling_example(priority_queue),
+        performance_example(performance_queue),
+    )
+
+  finally:
+    for each_queue in (queue, status_queue, priority_queue, performance_queue):
+      each_queue.shutdown()
 
   print("\n" + "=" * 50)
   print("All tests completed successfully!")
@@ -450,4 +512,10 @@ async def main():
 
 
 if __name__ == "__main__":
+  # Use uvloop's faster event loop when it is installed; it is optional and not available on Windows
+  try:
+    import uvloop  # pylint: disable=import-error
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+  except ImportError:
+    pass
   asyncio.run(main())
@@ -11,13 +11,18 @@ The queue manages only execute_command operations, while other operations
 """
 
 import asyncio
+import io
 import logging
+import re
 import sys
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
+from typing import Sequence, TextIO
 
-# Add the parent directories to the path to import modules
+# Add the project root to the end of the path to import modules, so imports of the standard library and installed
+# packages don't look in it first
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+sys.path.append(str(project_root))
 
 try:
   from external_system_interfaces.factory import create_interface  # pylint: disable=import-error
@@ -41,6 +46,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Instance every test sends its commands to
+INSTANCE_NAME = "resonite-headless-test"
+
 
 class StubCommandExecutor:
   """
@@ -83,20 +91,74 @@ class StubCommandExecutor:
     return self.stub_interface.execute_command(self.instance_name, command, timeout)
 
 
-async def test_basic_command_execution():
-  """Test basic command execution through the queue."""
-  print("\n=== Basic Command Execution Test ===")  # Create stub interface and executor
-  stub = create_interface(interface_type="stub")
-  instance_name = "resonite-headless-test"
-  executor = StubCommandExecutor(stub, instance_name)
+class FaultInjectionExecutor(StubCommandExecutor):
+  """
+  Custom executor that can simulate command failures for testing error handling.
+
+  This class extends StubCommandExecutor to add the ability to mark specific
+  commands as failing, allowing us to test error handling and recovery scenarios.
+  """
+
+  def __init__(self, stub_interface, instance_name):
+    super().__init__(stub_interface, instance_name)
+    self.fail_commands = set()
+
+  def add_failing_command(self, command):
+    """Mark a command to fail."""
+    self.fail_commands.add(command)
+
+  def remove_failing_command(self, command):
+    """Stop a command from failing."""
+    self.fail_commands.discard(command)
+
+  def execute_command(self, container_name: str, command: str, timeout: int) -> str:
+    if command in self.fail_commands:
+      raise ConnectionError(f"Simulated failure for command: {command}")
+    return super().execute_command(container_name, command, timeout)
 
-  # Create command queue
+
+def print_block_sections(out: TextIO, output: str, commands: Sequence[Command]) -> None:
+  """
+  Print a command block's output with a heading for each command's section.
+
+  The queue prefixes each command's output with "[command text] ", so the sections are found by
+  matching those prefixes at the start of a line, for the block's own commands only.
+  """
+  section_re = re.compile(r"(?m)^\[(%s)\] " % "|".join(re.escape(c.command_text) for c in commands))
+  matches = list(section_re.finditer(output))
+  for match, next_match in zip(matches, matches[1:] + [None]):
+    end = next_match.start() if next_match else len(output)
+    print(f"\n=== Command: {match.group(1)} ===\n{output[match.end():end].rstrip()}", file=out)
+
+
+@asynccontextmanager
+async def queue_harness(instance_name: str = INSTANCE_NAME):
+  """
+  Create the stub interface, executor and command queue shared by the tests.
+
+  Yields:
+      tuple: (stub, executor, queue); the queue is shut down on exit
+  """
+  stub = create_interface(interface_type="stub")
+  # Nothing fails until a test marks a command as failing
+  executor = FaultInjectionExecutor(stub, instance_name)
   queue = CommandQueue(
       container_name=instance_name,
-      command_executor=executor.execute_command,
-      max_queue_size=50
+      command_executor=executor.execute_command
   )
 
+  try:
+    yield stub, executor, queue
+  finally:
+    queue.shutdown()
+
+
+async def test_basic_command_execution(queue: CommandQueue):
+  """Test basic command execution through the queue."""
+  # Each test buffers its output and writes it in one go, so tests running concurrently don't interleave
+  out = io.StringIO()
+  print("\n=== Basic Command Execution Test ===", file=out)
+
   try:
     # Test basic Resonite commands
     commands_to_test = [
@@ -107,39 +169,32 @@ async def test_basic_command_execution():
         "sessionid"
     ]
 
-    print(f"Testing {len(commands_to_test)} basic commands...")
+    print(f"Testing {len(commands_to_test)} basic commands...", file=out)
 
-    for cmd in commands_to_test:
-      print(f"\nExecuting: {cmd}")
-      result = queue.add_command(cmd, timeout=10)
-      execution_result = await result.wait_for_completion()
+    # Queue every command up front in one batch, then wait for them all
+    results = queue.add_commands(commands_to_test, timeout=10)
+    execution_results = await asyncio.gather(*(r.wait_for_completion() for r in results))
 
-      print(f"Success: {execution_result.success}")
+    for cmd, execution_result in zip(commands_to_test, execution_results):
+      print(f"\nExecuted: {cmd}", file=out)
+      print(f"Success: {execution_result.success}", file=out)
       if execution_result.success:
         # Truncate long outputs for readability
         output = execution_result.output
         if len(output) > 100:
           output = output[:100] + "..."
-        print(f"Output: {output}")
+        print(f"Output: {output}", file=out)
       else:
-        print(f"Error: {execution_result.error}")
+        print(f"Error: {execution_result.error}", file=out)
 
   finally:
-    queue.shutdown()
+    sys.stdout.write(out.getvalue())
 
 
-async def test_command_blocks():
+async def test_command_blocks(queue: CommandQueue):
   """Test command blocks with related Resonite commands."""
-  print("\n=== Command Blocks Test ===")
-
-  stub = create_interface(interface_type="stub")
-  instance_name = "resonite-headless-test"
-  executor = StubCommandExecutor(stub, instance_name)
-
-  queue = CommandQueue(
-      container_name=instance_name,
-      command_executor=executor.execute_command
-  )
+  out = io.StringIO()
+  print("\n=== Command Blocks Test ===", file=out)
 
   try:
     # Create a world management command block
@@ -156,26 +211,15 @@ async def test_command_blocks():
         description="World management information gathering"
     )
 
-    print("Executing world management command block...")
+    print("Executing world management command block...", file=out)
     result = queue.add_command_block(world_mgmt_block)
     execution_result = await result.wait_for_completion()
 
-    print(f"Block execution success: {execution_result.success}")
-    print(f"Execution time: {execution_result.execution_time:.2f} seconds")
+    print(f"Block execution success: {execution_result.success}", file=out)
+    print(f"Execution time: {execution_result.execution_time:.2f} seconds", file=out)
 
     # Print each command's output section
-    outputs = execution_result.output.split('\n')
-    current_section = []
-    for line in outputs:
-      if line.startswith("=== Command:"):
-        if current_section:
-          print("".join(current_section))
-        current_section = [f"\n{line}\n"]
-      else:
-        current_section.append(f"{line}\n")
-
-    if current_section:
-      print("".join(current_section))
+    print_block_sections(out, execution_result.output, world_mgmt_commands)
 
     # Create a user management command block
     user_mgmt_commands = [
@@ -189,32 +233,24 @@ async def test_command_blocks():
         description="User management information"
     )
 
-    print("\nExecuting user management command block...")
+    print("\nExecuting user management command block...", file=out)
     result = queue.add_command_block(user_mgmt_block, priority=Priority.HIGH)
     execution_result = await result.wait_for_completion()
 
-    print(f"User mgmt block success: {execution_result.success}")
+    print(f"User mgmt block success: {execution_result.success}", file=out)
 
   finally:
-    queue.shutdown()
+    sys.stdout.write(out.getvalue())
 
 
-async def test_mixed_priorities():
+async def test_mixed_priorities(queue: CommandQueue):
   """Test commands with different priorities."""
-  print("\n=== Mixed Priorities Test ===")
-
-  stub = create_interface(interface_type="stub")
-  instance_name = "resonite-headless-test"
-  executor = StubCommandExecutor(stub, instance_name)
-
-  queue = CommandQueue(
-      container_name=instance_name,
-      command_executor=executor.execute_command
-  )
+  out = io.StringIO()
+  print("\n=== Mixed Priorities Test ===", file=out)
 
   try:
     # Add commands with different priorities
-    print("Adding commands with different priorities...")
+    print("Adding commands with different priorities...", file=out)
 
     # Add low priority commands first
     low1 = queue.add_command("debugworldstate", priority=Priority.LOW,
@@ -232,13 +268,13 @@ async def test_mixed_priorities():
 
     # Check queue status
     status = queue.get_status()
-    print(f"Queue length: {status['queue_length']}")
-    print("Queue items:")
+    print(f"Queue length: {status['queue_length']}", file=out)
+    print("Queue items:", file=out)
     for item in status['queue_items']:
-      print(f"  - {item['description']} (Priority: {item['priority']})")
+      print(f"  - {item['description']} (Priority: {item['priority']})", file=out)
 
     # Wait for all to complete
-    print("\nWaiting for command execution...")
+    print("\nWaiting for command execution...", file=out)
     results = await asyncio.gather(
         high.wait_for_completion(),
         normal.wait_for_completion(),
@@ -246,117 +282,94 @@ async def test_mixed_priorities():
         low2.wait_for_completion()
     )
 
-    print("\nExecution order and results:")
+    print("\nExecution order and results:", file=out)
     for i, result in enumerate(results):
       cmd_name = ["High priority", "Normal priority", "Low priority 1", "Low priority 2"][i]
-      print(f"{cmd_name}: Success={result.success}, Time={result.execution_time:.2f}s")
+      print(f"{cmd_name}: Success={result.success}, Time={result.execution_time:.2f}s", file=out)
 
   finally:
-    queue.shutdown()
+    sys.stdout.write(out.getvalue())
 
 
-async def test_direct_interface_operations():
+async def test_direct_interface_operations(stub: ExternalSystemInterface):
   """Test direct interface operations (not through queue)."""
-  print("\n=== Direct Interface Operations Test ===")
-
-  stub = create_interface(interface_type="stub")
-  instance_name = "resonite-headless-test"
-
-  print("Testing direct interface operations (bypassing queue)...")
-
-  # Test instance management operations
-  print(f"\n1. Checking if instance '{instance_name}' exists...")
-  exists = stub.instance_exists(instance_name)
-  print(f"   Instance exists: {exists}")
-
-  print("\n2. Getting instance status...")
-  status = stub.get_instance_status(instance_name)
-  print(f"   Status: {status}")
+  out = io.StringIO()
+  print("\n=== Direct Interface Operations Test ===", file=out)
 
-  print("\n3. Checking if instance is running...")
-  is_running = stub.is_instance_running(instance_name)
-  print(f"   Is running: {is_running}")
+  try:
+    instance_name = INSTANCE_NAME
 
-  if not is_running:
-    print("\n4. Starting instance...")
-    started = stub.start_instance(instance_name)
-    print(f"   Start successful: {started}")
+    print("Testing direct interface operations (bypassing queue)...", file=out)
 
-  print("\n5. Getting instance logs...")
-  logs = stub.get_instance_logs(instance_name, tail=5)
-  print(f"   Recent logs:\n{logs}")
+    # Test instance management operations
+    print(f"\n1. Checking if instance '{instance_name}' exists...", file=out)
+    exists = stub.instance_exists(instance_name)
+    print(f"   Instance exists: {exists}", file=out)
 
-  print("\n6. Listing all instances...")
-  instances = stub.list_instances()
-  print(f"   Found {len(instances)} instances:")
-  for instance in instances:
-    print(f"   - {instance['name']}: {instance['status']}")
+    print("\n2. Getting instance status...", file=out)
+    status = stub.get_instance_status(instance_name)
+    print(f"   Status: {status}", file=out)
 
-  print("\n7. Restarting instance...")
-  restarted = stub.restart_instance(instance_name)
-  print(f"   Restart successful: {restarted}")
+    print("\n3. Checking if instance is running...", file=out)
+    is_running = stub.is_instance_running(instance_name)
+    print(f"   Is running: {is_running}", file=out)
 
+    if not is_running:
+      print("\n4. Starting instance...", file=out)
+      started = stub.start_instance(instance_name)
+      print(f"   Start successful: {started}", file=out)
 
-async def test_error_handling():
-  """Test error handling in the queue system."""
-  print("\n=== Error Handling Test ===")
+    print("\n5. Getting instance logs...", file=out)
+    logs = stub.get_instance_logs(instance_name, tail=5)
+    print(f"   Recent logs:\n{logs}", file=out)
 
-  stub = create_interface(interface_type="stub")
-  instance_name = "resonite-headless-test"  # Create a custom executor that can simulate failures
-
-  class FaultInjectionExecutor(StubCommandExecutor):
-    """
-    Custom executor that can simulate command failures for testing error handling.
+    print("\n6. Listing all instances...", file=out)
+    instances = stub.list_instances()
+    print(f"   Found {len(instances)} instances:", file=out)
+    for instance in instances:
+      print(f"   - {instance['name']}: {instance['status']}", file=out)
 
-    This class extends StubCommandExecutor to add the ability to mark specific
-    commands as failing, allowing us to test error handling and recovery scenarios.
-    """
+    print("\n7. Restarting instance...", file=out)
+    restarted = stub.restart_instance(instance_name)
+    print(f"   Restart successful: {restarted}", file=out)
 
-    def __init__(self, stub_interface, instance_name):
-      super().__init__(stub_interface, instance_name)
-      self.fail_commands = set()
+  finally:
+    sys.stdout.write(out.getvalue())
 
-    def add_failing_command(self, command):
-      """Mark a command to fail."""
-      self.fail_commands.add(command)
 
-    def execute_command(self, container_name: str, command: str, timeout: int) -> str:
-      if command in self.fail_commands:
-        raise ConnectionError(f"Simulated failure for command: {command}")
-      return super().execute_command(container_name, command, timeout)
+async def test_error_handling(queue: CommandQueue, executor: FaultInjectionExecutor):
+  """Test error handling in the queue system."""
+  out = io.StringIO()
+  print("\n=== Error Handling Test ===", file=out)
 
-  executor = FaultInjectionExecutor(stub, instance_name)
   executor.add_failing_command("fail_test")
 
-  queue = CommandQueue(
-      container_name=instance_name,
-      command_executor=executor.execute_command
-  )
-
   try:
-    print("Testing error handling...")
+    print("Testing error handling...", file=out)
 
-    # Test successful command
-    print("\n1. Executing successful command...")
+    # Queue a successful command, one that will fail and another successful one to test recovery;
+    # the queue runs them in the order they were added
     success_result = queue.add_command("status")
-    result = await success_result.wait_for_completion()
-    print(f"   Success: {result.success}")
-
-    # Test failing command
-    print("\n2. Executing command that will fail...")
     fail_result = queue.add_command("fail_test")
-    result = await fail_result.wait_for_completion()
-    print(f"   Success: {result.success}")
-    print(f"   Error: {result.error}")
-
-    # Test recovery with another successful command
-    print("\n3. Testing recovery with another successful command...")
     recovery_result = queue.add_command("users")
-    result = await recovery_result.wait_for_completion()
-    print(f"   Recovery success: {result.success}")
+    success, failure, recovery = await asyncio.gather(
+        success_result.wait_for_completion(),
+        fail_result.wait_for_completion(),
+        recovery_result.wait_for_completion()
+    )
+
+    print("\n1. Executed successful command...", file=out)
+    print(f"   Success: {success.success}", file=out)
+
+    print("\n2. Executed command that will fail...", file=out)
+    print(f"   Success: {failure.success}", file=out)
+    print(f"   Error: {failure.error}", file=out)
+
+    print("\n3. Tested recovery with another successful command...", file=out)
+    print(f"   Recovery success: {recovery.success}", file=out)
 
     # Test command block with failure
-    print("\n4. Testing command block with failure...")
+    print("\n4. Testing command block with failure...", file=out)
     commands = [
         Command("status"),
         Command("fail_test"),  # This will fail
@@ -366,78 +379,70 @@ async def test_error_handling():
     block = CommandBlock(commands, description="Block with failure")
     block_result = queue.add_command_block(block)
     result = await block_result.wait_for_completion()
-    print(f"   Block success: {result.success}")
-    print(f"   Block error: {result.error}")
+    print(f"   Block success: {result.success}", file=out)
+    print(f"   Block error: {result.error}", file=out)
 
   finally:
-    queue.shutdown()
+    executor.remove_failing_command("fail_test")
+    sys.stdout.write(out.getvalue())
 
 
-async def test_queue_monitoring():
+async def test_queue_monitoring(queue: CommandQueue):
   """Test queue status monitoring capabilities."""
-  print("\n=== Queue Monitoring Test ===")
-
-  stub = create_interface(interface_type="stub")
-  instance_name = "resonite-headless-test"
-  executor = StubCommandExecutor(stub, instance_name)
-
-  queue = CommandQueue(
-      container_name=instance_name,
-      command_executor=executor.execute_command,
-      max_queue_size=20
-  )
+  out = io.StringIO()
+  print("\n=== Queue Monitoring Test ===", file=out)
 
   try:
-    print("Adding multiple commands to demonstrate monitoring...")
+    print("Adding multiple commands to demonstrate monitoring...", file=out)
 
-    # Add several commands without waiting
-    commands = [
-        ("status", Priority.NORMAL),
-        ("users", Priority.HIGH),
-        ("worlds", Priority.LOW),
-        ("sessionurl", Priority.NORMAL),
-        ("listbans", Priority.HIGH),
-        ("debugworldstate", Priority.LOW)
-    ]
+    # Add several commands without waiting, one batch per priority
+    commands = {
+        Priority.NORMAL: ["status", "sessionurl"],
+        Priority.HIGH: ["users", "listbans"],
+        Priority.LOW: ["worlds", "debugworldstate"]
+    }
 
     results = []
-    for cmd, priority in commands:
-      result = queue.add_command(cmd, priority=priority, description=f"Test {cmd}")
-      results.append(result)
+    for priority, batch in commands.items():
+      results.extend(queue.add_commands(batch, priority=priority))
 
-    # Monitor queue status during execution
-    print("\nMonitoring queue during execution...")
-    for i in range(3):
+    # Monitor queue status during execution, checking again each time it changes until the queue is empty
+    print("\nMonitoring queue during execution...", file=out)
+    status_check = 0
+    while True:
       status = queue.get_status()
-      print(f"\nStatus check {i+1}:")
-      print(f"  Queue length: {status['queue_length']}")
-      print(f"  Is processing: {status['is_processing']}")
-      print(f"  Completed count: {status['completed_count']}")
+      status_check += 1
+      print(f"\nStatus check {status_check}:", file=out)
+      print(f"  Queue length: {status['queue_length']}", file=out)
+      print(f"  Is processing: {status['is_processing']}", file=out)
+      print(f"  Completed count: {status['completed_count']}", file=out)
 
       if status['queue_items']:
-        print("  Pending items:")
+        print("  Pending items:", file=out)
         for item in status['queue_items']:
-          print(f"    - {item['description']} ({item['status']})")
+          print(f"    - {item['description']} ({item['status']})", file=out)
 
-      await asyncio.sleep(1)
+      if not status['queue_length']:
+        break
+      await queue.wait_for_status_change(status['status_version'], timeout=5)
 
     # Wait for all commands to complete
-    print("\nWaiting for all commands to complete...")
+    print("\nWaiting for all commands to complete...", file=out)
     await asyncio.gather(*[r.wait_for_completion() for r in results])
 
     # Final status
     final_status = queue.get_status()
-    print("\nFinal status:")
-    print(f"  Queue length: {final_status['queue_length']}")
-    print(f"  Total completed: {final_status['completed_count']}")
+    print("\nFinal status:", file=out)
+    print(f"  Queue length: {final_status['queue_length']}", file=out)
+    print(f"  Total completed: {final_status['completed_count']}", file=out)
 
     if final_status['recent_completed']:
-      print("  Recent completed items:")
+      print("  Recent completed items:", file=out)
       for item in final_status['recent_completed']:
-        print(f"    - {item['description']} -> {item['status']}")
+        print(f"    - {item['description']} -> {item['status']}", file=out)
 
   finally:
-    queue.shutdown()
+    sys.stdout.write(out.getvalue())
 
 
 async def main():
@@ -445,14 +450,30 @@ async def main():
   print("Command Queue + Stub Interface Integration Tests")
   print("=" * 60)
 
+  # Eager tasks (Python 3.12+) start running as soon as they are created, so a wait that can finish straight
+  # away does so without another pass through the event loop
+  if hasattr(asyncio, "eager_task_factory"):
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
   try:
-    # Run all test scenarios
-    await test_basic_command_execution()
-    await test_command_blocks()
-    await test_mixed_priorities()
-    await test_direct_interface_operations()
-    await test_error_handling()
-    await test_queue_monitoring()
+    # A queue runs one command at a time, so each queue test gets its own harness to let them run concurrently
+    async with AsyncExitStack() as stack:
+      harnesses = [await stack.enter_async_context(queue_harness()) for _ in range(5)]
+      results = await asyncio.gather(
+          test_basic_command_execution(harnesses[0][2]),
+          test_command_blocks(harnesses[1][2]),
+          test_mixed_priorities(harnesses[2][2]),
+          test_error_handling(harnesses[3][2], harnesses[3][1]),
+          test_queue_monitoring(harnesses[4][2]),
+          return_exceptions=True
+      )
+      failures = [result for result in results if isinstance(result, BaseException)]
+      if failures:
+        raise failures[0]
+
+    # Restarting the instance changes the stub's state, so the direct interface test runs on its own
+    async with queue_harness() as (stub, _, _):
+      await test_direct_interface_operations(stub)
 
     print("\n" + "=" * 60)
     print("All tests completed successfully!")
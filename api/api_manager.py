@@ -6,18 +6,95 @@ interface for API management with pluggable data sources.
 """
 
 import asyncio
+import functools
+import inspect
 import json
 import logging
-from typing import Dict, Any
+import time
+from typing import Dict, Any, FrozenSet, Tuple
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from rest_handlers import create_rest_endpoints
-from websocket_handlers import create_websocket_endpoints
+from rest_handlers import FastJSONResponse, create_rest_endpoints
+from websocket_handlers import create_websocket_endpoints, encode_json
+
+try:
+  import orjson  # pylint: disable=import-error
+except ImportError:
+  # orjson is in requirements.txt; fall back to the standard json module if it is missing anyway
+  orjson = None
 
 logger = logging.getLogger(__name__)
 default_server_ip = "127.0.0.1"
 
+# Timestamp sent when the data source does not provide one
+_FALLBACK_TIMESTAMP = "2025-06-08T12:00:00Z"
+
+# How long in seconds a data command's reply is reused before the data source is asked again
+_REPLY_TTL = 0.5
+
+# WebSocket commands answered from a single data source getter:
+# command -> (reply type, data source method, reply field, name used in error messages)
+_DATA_COMMANDS = {
+    "get_status": ("status_update", "get_server_status", "status", "Status"),
+    "get_worlds": ("worlds_update", "get_worlds_data", "worlds_data", "Worlds"),
+    "get_container_status": ("container_status_update", "get_container_status", "status", "Container status"),
+}
+
+# Origins always allowed by CORS; _build_origins adds the configured server IP's origin
+_STATIC_ORIGINS = (
+    "http://localhost:8080",
+    "http://127.0.0.1:8080",
+    "http://localhost:8000",
+    "http://127.0.0.1:8000",
+)
+
+# Methods and request headers the REST API and web UI actually use, allowed by CORS instead of wildcards
+_CORS_METHODS = ("GET", "POST")
+_CORS_HEADERS = ("Content-Type",)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(path: str = "config.json") -> Dict[str, Any]:
+  """
+  Read and parse the manager config file, once per process.
+
+  Returns an empty dict if the file is missing or not valid JSON. Call
+  _load_config.cache_clear() to make the next call read the file again.
+  """
+  try:
+    with open(path, "rb") as f:
+      data = f.read()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both are handled below
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+  except FileNotFoundError:
+    logger.info("%s not found, using default server IP", path)
+  except json.JSONDecodeError:
+    logger.error("Invalid JSON in %s, using default server IP", path)
+  return {}
+
+
+@functools.lru_cache(maxsize=4)
+def _build_origins(server_ip: str) -> FrozenSet[str]:
+  """
+  Return the origins CORS allows for a server IP: the static origins plus the server's API origin.
+
+  CORSMiddleware checks origins with `in`, so a frozenset makes that check a hash lookup.
+  """
+  return frozenset(_STATIC_ORIGINS) | {f"http://{server_ip}:8000"}
+
+
+async def _call_data_source(method, *args):
+  """Call a data source method, awaiting it if it is async and running it in a worker thread if it blocks."""
+  if inspect.iscoroutinefunction(method):
+    return await method(*args)
+  return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+
+async def _send_json(websocket, data: Dict[str, Any]) -> None:
+  """Send a message as a JSON text frame, which is what the web UI expects."""
+  await websocket.send_text(encode_json(data))
+
 
 class APIManager:
   """
@@ -40,63 +117,48 @@ class APIManager:
         title="Resonite Headless Manager API",
         description="WebSocket and REST API for managing Resonite headless servers",
         version="0.0.1-dev",
+        default_response_class=FastJSONResponse,
         redoc_url=None,  # Disable ReDoc endpoint
         docs_url=None  # Disable Swagger UI endpoint
     )
-    # set default server IP
-    self.server_ip = default_server_ip
-    # get server ip from config.json file
-    # open config.json and read the server_ip field
-    try:
-      with open("config.json", "r", encoding="utf-8") as f:
-        config = f.read()
-        # Assuming config is a JSON string, parse it
-        config_data = json.loads(config)
-        self.server_ip = config_data.get("server_ip", default_server_ip)
-    except FileNotFoundError:
-      logger.info("config.json not found, using default server IP")
-    except json.JSONDecodeError:
-      logger.error("Invalid JSON in config.json, using default server IP")
+    # get server ip from config.json, falling back to the default server IP
+    self.server_ip = _load_config().get("server_ip", default_server_ip)
 
     # Add CORS middleware
     self.app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "http://localhost:8080",
-            "http://127.0.0.1:8080",
-            "http://localhost:8000",
-            "http://127.0.0.1:8000",
-            "http://" + self.server_ip + ":8000"
-        ],
+        allow_origins=_build_origins(self.server_ip),
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=_CORS_METHODS,
+        allow_headers=_CORS_HEADERS,
     )
 
     self.request_locks = {}
     self.command_handlers = {}
+    # Most recent reply to each data command as (time.monotonic() when fetched, encoded reply),
+    # reused for _REPLY_TTL seconds and handed to requests that arrive while it is being fetched
+    self._latest_replies: Dict[str, Tuple[float, str]] = {}
 
     self._setup_locks()
     self._setup_command_handlers()
     self._setup_endpoints()
 
   def _setup_locks(self):
-    """Set up request locks for different operations."""
-    self.request_locks = {
-        "get_status": asyncio.Lock(),
-        "get_worlds": asyncio.Lock(),
-        "get_container_status": asyncio.Lock(),
-        "command": asyncio.Lock()
-    }
+    """
+    Set up the request locks.
+
+    Each data command's lock is held while its data is being fetched. The "command" lock is held while a
+    command runs, so commands from any number of clients still run one at a time.
+    """
+    self.request_locks = {command: asyncio.Lock() for command in _DATA_COMMANDS}
+    self.request_locks["command"] = asyncio.Lock()
 
   def _setup_command_handlers(self):
     """Set up command handlers for WebSocket operations."""
     self.command_handlers = {
-        "get_status": self._handle_status_command,
-        "get_worlds": self._handle_worlds_command,
-        "get_container_status": self._handle_container_status_command,
-        "command": self._handle_general_command
+        command: functools.partial(self._handle_data_command, command) for command in _DATA_COMMANDS
     }
+    self.command_handlers["command"] = self._handle_general_command
 
   def _setup_endpoints(self):
     """Set up all REST and WebSocket endpoints."""
@@ -105,71 +167,63 @@ class APIManager:
     create_websocket_endpoints(
         self.app,
         self.data_source,
-        self.request_locks,
         self.command_handlers
     )
 
     logger.info("API endpoints configured with data source: %s",
                 self.data_source.__class__.__name__)
 
-  async def _handle_status_command(self, websocket, _data):
-    """Handle status command via WebSocket."""
+  async def _handle_data_command(self, command, websocket, _data):
+    """Handle a WebSocket command listed in _DATA_COMMANDS."""
+    name = _DATA_COMMANDS[command][3]
+    lock = self.request_locks[command]
     try:
-      # Get server status from data source
-      server_status = self.data_source.get_server_status()
-      status_data = {
-          "type": "status_update",
-          "status": server_status,
-          "timestamp": server_status.get("server_time", "2025-06-08T12:00:00Z")
-      }
-      await websocket.send_json(status_data)
-    except (RuntimeError, AttributeError, KeyError, ValueError, OSError) as e:
-      logger.error("Error handling status command: %s", str(e))
-      await websocket.send_json({
-          "type": "error",
-          "message": f"Status command failed: {e}"
-      })
+      reply = self._latest_replies.get(command)
+      if reply is not None and time.monotonic() - reply[0] < _REPLY_TTL:
+        # Fetched moments ago, send it again
+        await websocket.send_text(reply[1])
+        return
 
-  async def _handle_worlds_command(self, websocket, _data):
-    """Handle worlds command via WebSocket."""
-    try:
-      # Get worlds data from data source
-      worlds_data = self.data_source.get_worlds_data()
-      response_data = {
-          "type": "worlds_update",
-          "worlds_data": worlds_data,
-          "timestamp": "2025-06-08T12:00:00Z",
-          "cached": False
-      }
-      await websocket.send_json(response_data)
+      reply = None
+      if lock.locked():
+        # Another request is already fetching this data: wait for it and send the same reply
+        async with lock:
+          reply = self._latest_replies.get(command)
+      if reply is None:
+        async with lock:
+          reply = await self._fetch_data_reply(command)
+      await websocket.send_text(reply[1])
     except (RuntimeError, AttributeError, KeyError, ValueError, OSError) as e:
-      logger.error("Error handling worlds command: %s", str(e))
-      await websocket.send_json({
+      logger.error("Error handling %s command: %s", name.lower(), str(e))
+      await _send_json(websocket, {
           "type": "error",
-          "message": f"Worlds command failed: {e}"
+          "message": f"{name} command failed: {e}"
       })
 
-  async def _handle_container_status_command(self, websocket, _data):
-    """Handle container status command via WebSocket."""
-    try:
-      status = self.data_source.get_container_status()
-      await websocket.send_json({
-          "type": "container_status_update",
-          "status": status
-      })
-    except (RuntimeError, AttributeError, KeyError, ValueError, OSError) as e:
-      logger.error("Error handling container status command: %s", str(e))
-      await websocket.send_json({
-          "type": "error",
-          "message": f"Container status command failed: {e}"
-      })
+  async def _fetch_data_reply(self, command) -> Tuple[float, str]:
+    """Fetch the data for a command listed in _DATA_COMMANDS and encode its reply; call with its lock held."""
+    reply_type, getter_name, field, _ = _DATA_COMMANDS[command]
+    # Drop the previous reply so requests waiting on this fetch don't get it if the fetch fails
+    self._latest_replies.pop(command, None)
+
+    payload = await _call_data_source(getattr(self.data_source, getter_name))
+    message = {"type": reply_type, field: payload}
+    if command == "get_status":
+      message["timestamp"] = payload.get("server_time", _FALLBACK_TIMESTAMP)
+    elif command == "get_worlds":
+      message["timestamp"] = _FALLBACK_TIMESTAMP
+      message["cached"] = False
+
+    reply = (time.monotonic(), encode_json(message))
+    self._latest_replies[command] = reply
+    return reply
 
   async def _handle_general_command(self, websocket, data):
     """Handle general commands via WebSocket."""
     try:
       command = data.get("command", "")
       if not command:
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "error",
             "message": "No command specified"
         })
@@ -177,7 +231,7 @@ class APIManager:
 
       target_world_instance = data.get("target_world_instance", None)
       if not target_world_instance:
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "error",
             "message": "No target world instance specified"
         })
@@ -185,18 +239,21 @@ class APIManager:
 
       command_mode = data.get("command_mode", "default")
       if command_mode not in ["default", "direct"]:
-        await websocket.send_json({
+        await _send_json(websocket, {
             "type": "error",
             "message": f"Invalid command mode: {command_mode}"
         })
         return
 
-      # Use data source to get structured command response
-      response = self.data_source.get_structured_command_response(command, target_world_instance, command_mode)
-      await websocket.send_json(response)
+      # Use data source to get structured command response. It runs off the event loop so other WebSocket
+      # requests are still handled meanwhile, but under the command lock so commands never run concurrently
+      async with self.request_locks["command"]:
+        response = await _call_data_source(self.data_source.get_structured_command_response,
+                                           command, target_world_instance, command_mode)
+      await _send_json(websocket, response)
     except (RuntimeError, AttributeError, KeyError, ValueError, OSError) as e:
       logger.error("Error handling command: %s", str(e))
-      await websocket.send_json({
+      await _send_json(websocket, {
           "type": "error",
           "message": f"Command failed: {e}"
       })
@@ -8,6 +8,7 @@ This module provides:
 - Status and settings endpoints
 """
 
+import functools
 import json
 import logging
 import os
@@ -16,9 +17,24 @@ from typing import Any, Dict
 from fastapi import HTTPException
 from fastapi.responses import HTMLResponse, JSONResponse
 
+try:
+  import orjson  # pylint: disable=import-error
+except ImportError:
+  # orjson is in requirements.txt; fall back to the standard json module if it is missing anyway
+  orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+class FastJSONResponse(JSONResponse):
+  """JSONResponse that encodes its content with orjson when it is installed."""
+
+  def render(self, content: Any) -> bytes:
+    if orjson is None:
+      return super().render(content)
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 def get_config_path(data_source=None) -> str:
   """
   Get the configuration file path from data source settings or environment.
@@ -84,13 +100,23 @@ def save_config(config_data: Dict[Any, Any], data_source=None) -> None:
     json.dump(config_data, f, indent=2)
 
 
+@functools.lru_cache(maxsize=None)
+def _read_template(template_path: str) -> bytes:
+  """
+  Read a template file, once per path.
+
+  A missing file raises FileNotFoundError, which is not cached, so the file is looked for again on the next call.
+  """
+  with open(template_path, "rb") as f:
+    return f.read()
+
+
 # Endpoint handler functions
 async def _get_root_handler(templates_path: str):
   """Serve the main web interface HTML page."""
   template_path = f"{templates_path}/api-index.html"
   try:
-    with open(template_path, encoding='utf-8') as f:
-      return HTMLResponse(content=f.read())
+    return HTMLResponse(content=_read_template(template_path))
   except FileNotFoundError:
     logger.error("Template not found: %s", template_path)
     return HTMLResponse(
@@ -104,7 +130,7 @@ async def _get_config_handler(data_source):
   """Get the current headless config"""
   try:
     result = load_config(data_source)
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except ValueError as e:
     logger.error("Error in get_config endpoint: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -117,7 +143,7 @@ async def _update_config_handler(config_data: Dict[Any, Any], data_source):
   """Update the headless config"""
   try:
     save_config(config_data, data_source)
-    return JSONResponse(content={"message": "Config updated successfully"})
+    return FastJSONResponse(content={"message": "Config updated successfully"})
   except ValueError as e:
     raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -126,7 +152,7 @@ async def _restart_container_handler(data_source):
   """Restart the Docker container"""
   try:
     data_source.restart_container()
-    return JSONResponse(content={"message": "Container restart initiated"})
+    return FastJSONResponse(content={"message": "Container restart initiated"})
   except (ConnectionError, RuntimeError) as e:
     logger.error("Error restarting container: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -137,8 +163,8 @@ async def _start_container_handler(data_source):
   try:
     if not data_source.is_container_running():
       data_source.start_container()
-      return JSONResponse(content={"message": "Container start initiated"})
-    return JSONResponse(content={"message": "Container is already running"})
+      return FastJSONResponse(content={"message": "Container start initiated"})
+    return FastJSONResponse(content={"message": "Container is already running"})
   except (ConnectionError, RuntimeError) as e:
     logger.error("Error starting container: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -149,8 +175,8 @@ async def _stop_container_handler(data_source):
   try:
     if data_source.is_container_running():
       data_source.stop_container()
-      return JSONResponse(content={"message": "Container stop initiated"})
-    return JSONResponse(content={"message": "Container is already stopped"})
+      return FastJSONResponse(content={"message": "Container stop initiated"})
+    return FastJSONResponse(content={"message": "Container is already stopped"})
   except (ConnectionError, RuntimeError) as e:
     logger.error("Error stopping container: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -160,7 +186,7 @@ async def _get_config_status_handler(data_source):
   """Get whether the app is using builtin or config file settings"""
   try:
     result = data_source.get_config_status()
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except Exception as e:
     logger.error("Error in get_config_status endpoint: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -170,7 +196,7 @@ async def _get_manager_config_settings_handler(data_source):
   """Get current configuration settings"""
   try:
     result = data_source.get_manger_config_settings()
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except Exception as e:
     logger.error("Error in get_manger_config_settings endpoint: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -180,7 +206,7 @@ async def _update_manager_config_settings_handler(settings_data: Dict[Any, Any],
   """Update manager configuration settings"""
   try:
     result = data_source.update_manager_config_settings(settings_data)
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except ValueError as e:
     raise HTTPException(status_code=400, detail=str(e)) from e
   except Exception as e:
@@ -192,7 +218,7 @@ async def _generate_config_handler(data_source):
   """Generate config file and switch to using it"""
   try:
     result = data_source.generate_config()
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except Exception as e:
     logger.error("Error generating config file: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -202,7 +228,7 @@ async def _get_command_info_handler(data_source):
   """Get available command information from the data source"""
   try:
     result = data_source.get_command_info()
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except Exception as e:
     logger.error("Error in get_command_info endpoint: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -212,7 +238,7 @@ async def _get_supported_commands_handler(data_source):
   """Get list of supported commands from the data source"""
   try:
     result = data_source.get_supported_commands()
-    return JSONResponse(content=result)
+    return FastJSONResponse(content=result)
   except Exception as e:
     logger.error("Error in get_supported_commands endpoint: %s", str(e))
     raise HTTPException(status_code=500, detail=str(e)) from e
@@ -12,6 +12,7 @@ import asyncio
 import json
 import logging
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Set
@@ -19,8 +20,35 @@ from typing import Set
 from fastapi import WebSocket, WebSocketDisconnect
 from starlette.websockets import WebSocketState
 
+try:
+  import orjson  # pylint: disable=import-error
+except ImportError:
+  # orjson is in requirements.txt; fall back to the standard json module if it is missing anyway
+  orjson = None
+
 logger = logging.getLogger(__name__)
 
+# How long a formatted timestamp is reused before current_timestamp() formats a new one, in seconds
+_TIMESTAMP_TTL = 0.05
+# (time.monotonic() when formatted, ISO 8601 timestamp), replaced as a whole so threads never see half an update
+_cached_timestamp = (float("-inf"), "")
+
+
+def current_timestamp() -> str:
+  """Return the current local time as an ISO 8601 string, formatting a new one at most every 50 ms."""
+  global _cached_timestamp  # pylint: disable=global-statement
+  now = time.monotonic()
+  if now - _cached_timestamp[0] >= _TIMESTAMP_TTL:
+    _cached_timestamp = (now, datetime.now().isoformat())
+  return _cached_timestamp[1]
+
+
+def encode_json(data: dict) -> str:
+  """Serialise a WebSocket message the same way WebSocket.send_json does, using orjson when it is installed."""
+  if orjson is not None:
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+  return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
 
 @dataclass
 class ConnectionManager:
@@ -56,15 +84,30 @@ class ConnectionManager:
     Args:
         message (dict): The message to broadcast to all connections
     """
-    for connection in self.active_connections.copy():
-      try:
-        if await is_websocket_connected(connection):
-          await connection.send_json(message)
-        else:
-          self.active_connections.discard(connection)
-      except (ConnectionError, RuntimeError, ValueError) as e:
-        logger.error("Error broadcasting to connection: %s", str(e))
-        self.active_connections.discard(connection)
+    # The state check doesn't await, so the set can be iterated directly and closed connections dropped afterwards
+    connections = []
+    closed = []
+    for connection in self.active_connections:
+      if connection.client_state == WebSocketState.CONNECTED:
+        connections.append(connection)
+      else:
+        closed.append(connection)
+    self.active_connections.difference_update(closed)
+
+    # Encode the message once and send it to every connection at the same time
+    text = encode_json(message)
+    results = await asyncio.gather(*(connection.send_text(text) for connection in connections),
+                                   return_exceptions=True)
+    failed = []
+    try:
+      for connection, result in zip(connections, results):
+        if isinstance(result, (ConnectionError, RuntimeError, ValueError)):
+          logger.error("Error broadcasting to connection: %s", str(result))
+          failed.append(connection)
+        elif isinstance(result, BaseException):
+          raise result
+    finally:
+      self.active_connections.difference_update(failed)
 
 
 # Create connection managers for different types of connections
@@ -92,9 +135,9 @@ async def safe_send_json(websocket: WebSocket, data: dict) -> bool:
     if await is_websocket_connected(websocket):
       # Add timestamp if not already present
       if "timestamp" not in data:
-        data["timestamp"] = datetime.now().isoformat()
+        data["timestamp"] = current_timestamp()
 
-      await websocket.send_json(data)
+      await websocket.send_text(encode_json(data))
       return True
     return False
   except (ConnectionError, RuntimeError) as e:
@@ -102,28 +145,20 @@ async def safe_send_json(websocket: WebSocket, data: dict) -> bool:
     return False
 
 
-async def handle_websocket_message(websocket: WebSocket, message: str, request_locks: dict, handlers: dict):
+async def handle_websocket_message(websocket: WebSocket, message: str, handlers: dict):
   """
   Handle individual WebSocket messages
 
   Args:
       websocket: The WebSocket connection
       message: The raw message string
-      request_locks: Dictionary of locks for different request types
       handlers: Dictionary of handler functions for different message types
   """
   try:
-    data = json.loads(message)
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the handler below covers both
+    data = orjson.loads(message) if orjson is not None else json.loads(message)
     message_type = data.get("type", "")
 
-    if message_type in request_locks and request_locks[message_type].locked():
-      logger.warning("Request of type %s already in progress, skipping", message_type)
-      await safe_send_json(websocket, {
-          "type": "error",
-          "message": f"A {message_type} request is already in progress"
-      })
-      return
-
     # Route to appropriate handler
     if message_type in handlers:
       await handlers[message_type](websocket, data)
@@ -173,14 +208,14 @@ async def _handle_logs_websocket(websocket: WebSocket, data_source):
       await safe_send_json(websocket, {
           "type": "container_output",
           "output": log_line,
-          "timestamp": datetime.now().isoformat()
+          "timestamp": current_timestamp()
       })
 
     async def stream_callback(output):
       await logs_manager.broadcast({
           "type": "container_output",
           "output": output,
-          "timestamp": datetime.now().isoformat()
+          "timestamp": current_timestamp()
       })
 
     loop = asyncio.get_running_loop()
@@ -207,8 +242,7 @@ async def _handle_logs_websocket(websocket: WebSocket, data_source):
 
 
 async def _handle_message_based_websocket(websocket: WebSocket, manager: ConnectionManager,
-                                          request_locks: dict, command_handlers: dict,
-                                          handler_key: str, endpoint_name: str):
+                                          command_handlers: dict, handler_key: str, endpoint_name: str):
   """Handle WebSocket connections that process messages with handlers"""
   await manager.connect(websocket)
 
@@ -216,7 +250,7 @@ async def _handle_message_based_websocket(websocket: WebSocket, manager: Connect
     while await is_websocket_connected(websocket):
       async def message_handler(ws, msg):
         return await handle_websocket_message(
-            ws, msg, request_locks, {handler_key: command_handlers[handler_key]}
+            ws, msg, {handler_key: command_handlers[handler_key]}
         )
       await monitor_websocket(websocket, message_handler)
 
@@ -235,10 +269,10 @@ async def _handle_heartbeat_websocket(websocket: WebSocket):
     while True:
       await asyncio.sleep(30)  # Send heartbeat every 30 seconds
       if await is_websocket_connected(websocket):
-        await websocket.send_json({
+        await websocket.send_text(encode_json({
             "type": "heartbeat",
-            "timestamp": datetime.now().isoformat()
-        })
+            "timestamp": current_timestamp()
+        }))
       else:
         break
   except WebSocketDisconnect:
@@ -282,14 +316,13 @@ async def _handle_monitoring_websocket(websocket: WebSocket, manager: Connection
     await manager.disconnect(websocket)
 
 
-def create_websocket_endpoints(app, data_source, request_locks, command_handlers):
+def create_websocket_endpoints(app, data_source, command_handlers):
   """
   Create all WebSocket endpoints for the FastAPI app
 
   Args:
       app: FastAPI application instance
       data_source: Data source instance for container operations (BaseDataSource)
-      request_locks: Dictionary of locks for different request types
       command_handlers: Dictionary of command handler functions
   """
   @app.websocket("/ws/logs")
@@ -301,7 +334,7 @@ def create_websocket_endpoints(app, data_source, request_locks, command_handlers
   async def status_endpoint(websocket: WebSocket):
     """Handle status monitoring WebSocket connections"""
     await _handle_message_based_websocket(
-        websocket, status_manager, request_locks, command_handlers,
+        websocket, status_manager, command_handlers,
         "get_status", "Status"
     )
 
@@ -309,7 +342,7 @@ def create_websocket_endpoints(app, data_source, request_locks, command_handlers
   async def worlds_endpoint(websocket: WebSocket):
     """Handle worlds list WebSocket connections"""
     await _handle_message_based_websocket(
-        websocket, worlds_manager, request_locks, command_handlers,
+        websocket, worlds_manager, command_handlers,
         "get_worlds", "Worlds"
     )
 
@@ -317,7 +350,7 @@ def create_websocket_endpoints(app, data_source, request_locks, command_handlers
   async def command_endpoint(websocket: WebSocket):
     """Handle command WebSocket connections"""
     await _handle_message_based_websocket(
-        websocket, commands_manager, request_locks, command_handlers,
+        websocket, commands_manager, command_handlers,
         "command", "Command"
     )
 
@@ -346,7 +379,7 @@ def create_websocket_endpoints(app, data_source, request_locks, command_handlers
   async def container_status_endpoint(websocket: WebSocket):
     """Handle container status WebSocket connections"""
     await _handle_message_based_websocket(
-        websocket, container_status_manager, request_locks, command_handlers,
+        websocket, container_status_manager, command_handlers,
         "get_container_status", "Container Status"
     )
 
@@ -360,7 +393,7 @@ async def send_output(output):
     await logs_manager.broadcast({
         "type": "container_output",
         "output": output,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": current_timestamp()
     })
   except (ConnectionError, RuntimeError) as e:
     logger.error("Error broadcasting output: %s", str(e))
@@ -22,11 +22,13 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+NS_PER_SECOND = 1_000_000_000
+
 
 class CacheStatus(Enum):
   """Status of cached data."""
@@ -50,37 +52,46 @@ class CacheEntry:
   last_accessed: datetime = field(default_factory=datetime.now)
   status: CacheStatus = CacheStatus.FRESH
 
+  # Age tracking, in integer nanoseconds of the clock the entry was created with.
+  # A monotonic clock keeps freshness correct across system clock changes.
+  clock: Callable[[], int] = field(default=time.perf_counter_ns, repr=False, compare=False)
+  created_ns: Optional[int] = field(default=None, compare=False)
+
   def __post_init__(self):
     """Validate cache entry after initialization."""
     if self.ttl_seconds <= 0:
       raise ValueError("TTL must be positive")
     if not self.category:
       raise ValueError("Category cannot be empty")
+    if self.created_ns is None:
+      self.created_ns = self.clock()
 
   def is_fresh(self) -> bool:
     """Check if the cached data is still fresh (within TTL)."""
     if self.status == CacheStatus.INVALID:
       return False
 
-    age = datetime.now() - self.timestamp
-    return age.total_seconds() < self.ttl_seconds
+    return self._get_age_ns() < self.ttl_seconds * NS_PER_SECOND
 
   def is_expired(self) -> bool:
     """Check if the cached data has expired."""
     if self.status == CacheStatus.INVALID:
       return True
 
-    age = datetime.now() - self.timestamp
     # Consider expired if older than 2x TTL
-    return age.total_seconds() > (self.ttl_seconds * 2)
+    return self._get_age_ns() > (self.ttl_seconds * 2 * NS_PER_SECOND)
+
+  def _get_age_ns(self) -> int:
+    """Get the age of the cached data in nanoseconds."""
+    return self.clock() - self.created_ns
 
   def get_age_seconds(self) -> float:
     """Get the age of the cached data in seconds."""
-    return (datetime.now() - self.timestamp).total_seconds()
+    return self._get_age_ns() / NS_PER_SECOND
 
   def get_remaining_ttl(self) -> float:
     """Get remaining TTL in seconds (can be negative if stale)."""
-    return self.ttl_seconds - self.get_age_seconds()
+    return (self.ttl_seconds * NS_PER_SECOND - self._get_age_ns()) / NS_PER_SECOND
 
   def mark_accessed(self) -> None:
     """Mark this entry as accessed (updates access tracking)."""
@@ -164,7 +175,8 @@ class CacheManager:
   def __init__(self,
                default_ttl: int = 300,
                max_entries: int = 1000,
-               cleanup_interval: int = 60):
+               cleanup_interval: int = 60,
+               time_func: Callable[[], int] = time.perf_counter_ns):
     """
     Initialize the cache manager.
 
@@ -172,15 +184,20 @@ class CacheManager:
         default_ttl: Default time-to-live in seconds
         max_entries: Maximum number of cache entries
         cleanup_interval: Interval in seconds for automatic cleanup
+        time_func: Clock used to age entries, returning integer nanoseconds (tests can pass a fake clock)
     """
     self.default_ttl = default_ttl
     self.max_entries = max_entries
     self.cleanup_interval = cleanup_interval
+    self.time_func = time_func
 
     # Cache storage: {key: CacheEntry}
     self._cache: Dict[str, CacheEntry] = {}
     self._cache_lock = threading.RLock()
 
+    # Number of stored entries per category, kept in step with _cache: {category: count}
+    self._category_counts: Dict[str, int] = {}
+
     # Statistics tracking
     self._stats = CacheStats()
     self._stats_lock = threading.RLock()
@@ -214,46 +231,93 @@ class CacheManager:
     Returns:
         bool: True if data was successfully cached
     """
+    entry = self._create_entry(key, data, ttl, category, metadata)
+    if entry is None:
+      return False
+
+    with self._cache_lock:
+      self._store_entry(key, entry)
+
+    # Update statistics
+    with self._stats_lock:
+      self._record_set(entry)
+
+    return True
+
+  def set_many(self, items: Iterable[Tuple[str, Any, Dict[str, Any]]]) -> int:
+    """
+    Store several entries in the cache under a single lock acquisition.
+
+    Args:
+        items: (key, data, options) tuples, where options holds any of the
+               ttl, category and metadata arguments accepted by set()
+
+    Returns:
+        int: Number of entries successfully cached
+    """
+    entries = []
+    for key, data, options in items:
+      entry = self._create_entry(key, data, **options)
+      if entry is not None:
+        entries.append((key, entry))
+
+    with self._cache_lock:
+      for key, entry in entries:
+        self._store_entry(key, entry)
+
+    # Update statistics
+    with self._stats_lock:
+      for _, entry in entries:
+        self._record_set(entry)
+
+    return len(entries)
+
+  def _create_entry(self,
+                    key: str,
+                    data: Any,
+                    ttl: Optional[int] = None,
+                    category: str = "default",
+                    metadata: Optional[Dict[str, Any]] = None) -> Optional[CacheEntry]:
+    """Validate the data for a key and wrap it in a new cache entry, or return None if it cannot be cached."""
     if not key:
       logger.warning("Cannot cache data with empty key")
-      return False
+      return None
 
     # Validate data is JSON serializable
     try:
       json.dumps(data)
     except (TypeError, ValueError) as e:
       logger.error("Data for key '%s' is not JSON serializable: %s", key, str(e))
-      return False
-
-    effective_ttl = ttl if ttl is not None else self.default_ttl
-    effective_metadata = metadata or {}
+      return None
 
-    # Create cache entry
-    entry = CacheEntry(
+    return CacheEntry(
         data=data,
         timestamp=datetime.now(),
-        ttl_seconds=effective_ttl,
+        ttl_seconds=ttl if ttl is not None else self.default_ttl,
         category=category,
-        metadata=effective_metadata
+        metadata=metadata or {},
+        clock=self.time_func
     )
 
-    with self._cache_lock:
-      # Check if we need to make room
-      if len(self._cache) >= self.max_entries and key not in self._cache:
-        self._evict_oldest_entry()
-
-      # Store the entry
-      self._cache[key] = entry
+  def _store_entry(self, key: str, entry: CacheEntry) -> None:
+    """Store an entry, evicting the oldest one if the cache is full. The caller must hold the cache lock."""
+    # Check if we need to make room
+    if len(self._cache) >= self.max_entries and key not in self._cache:
+      self._evict_oldest_entry()
 
-      logger.debug("Cached data for key '%s' (TTL: %ds, Category: %s)",
-                   key, effective_ttl, category)
+    previous = self._cache.get(key)
+    if previous is not None:
+      self._uncount_category(previous.category)
+    self._cache[key] = entry
+    self._category_counts[entry.category] = self._category_counts.get(entry.category, 0) + 1
 
-    # Update statistics
-    with self._stats_lock:
-      self._stats.total_sets += 1
-      self._stats.categories[category] = self._stats.categories.get(category, 0) + 1
+    logger.debug("Cached data for key '%s' (TTL: %ds, Category: %s)",
+                 key, entry.ttl_seconds, entry.category)
 
-    return True
+  def _record_set(self, entry: CacheEntry) -> None:
+    """Count a stored entry in the statistics. The caller must hold the stats lock."""
+    self._stats.total_sets += 1
+    self._stats.categories[entry.category] = self._stats.categories.get(entry.category, 0) + 1
 
   def get(self, key: str, include_stale: bool = False) -> Optional[CacheEntry]:
     """
@@ -270,41 +334,73 @@ class CacheManager:
       return None
 
     with self._cache_lock:
-      entry = self._cache.get(key)
-      if entry is None:
-        with self._stats_lock:
-          self._stats.total_misses += 1
-        return None
+      return self._lookup_entry(key, include_stale)
 
-      # Mark as accessed
-      entry.mark_accessed()
+  def _lookup_entry(self, key: str, include_stale: bool) -> Optional[CacheEntry]:
+    """
+    Look up a single entry and record the hit or miss.
 
-      # Check if data is usable
-      if entry.is_expired():
-        logger.debug("Cache entry for key '%s' is expired", key)
-        with self._stats_lock:
-          self._stats.total_misses += 1
-        return None
+    The caller must hold the cache lock.
+    """
+    entry = self._cache.get(key)
+    if entry is None:
+      with self._stats_lock:
+        self._stats.total_misses += 1
+      return None
 
-      if not entry.is_fresh() and not include_stale:
-        logger.debug("Cache entry for key '%s' is stale (not including stale)", key)
-        with self._stats_lock:
-          self._stats.total_misses += 1
-        return None
+    # Mark as accessed
+    entry.mark_accessed()
 
-      # Update entry status
-      if entry.is_fresh():
-        entry.status = CacheStatus.FRESH
-      else:
-        entry.status = CacheStatus.STALE
+    # Check if data is usable
+    if entry.is_expired():
+      logger.debug("Cache entry for key '%s' is expired", key)
+      with self._stats_lock:
+        self._stats.total_misses += 1
+      return None
 
+    if not entry.is_fresh() and not include_stale:
+      logger.debug("Cache entry for key '%s' is stale (not including stale)", key)
       with self._stats_lock:
-        self._stats.total_hits += 1
+        self._stats.total_misses += 1
+      return None
+
+    # Update entry status
+    if entry.is_fresh():
+      entry.status = CacheStatus.FRESH
+    else:
+      entry.status = CacheStatus.STALE
+
+    with self._stats_lock:
+      self._stats.total_hits += 1
+
+    logger.debug("Cache hit for key '%s' (age: %.1fs, status: %s)",
+                 key, entry.get_age_seconds(), entry.status.value)
 
-      logger.debug("Cache hit for key '%s' (age: %.1fs, status: %s)",
-                   key, entry.get_age_seconds(), entry.status.value)
+    return entry
 
-      return entry
+  def get_many(self, keys: List[str], include_stale: bool = False) -> Dict[str, Any]:
+    """
+    Retrieve the data for several keys under a single lock acquisition.
+
+    Every key is counted as a hit or miss exactly as if it had been passed to
+    get() on its own, including repeated keys.
+
+    Args:
+        keys: Keys to look up
+        include_stale: Whether to return stale data
+
+    Returns:
+        Dictionary mapping each key found and valid to its cached data
+    """
+    results = {}
+    with self._cache_lock:
+      for key in keys:
+        if not key:
+          continue
+        entry = self._lookup_entry(key, include_stale)
+        if entry is not None:
+          results[key] = entry.data
+    return results
 
   def get_data(self, key: str, include_stale: bool = False) -> Optional[Any]:
     """
@@ -334,6 +430,23 @@ class CacheManager:
     entry = self.get(key, include_stale=not fresh_only)
     return entry is not None
 
+  def contains_all(self, keys: List[str], fresh_only: bool = True) -> bool:
+    """
+    Check that every one of several keys exists in the cache.
+
+    Uses get_many(), so the whole check happens under one lock acquisition
+    and each key is counted as a hit or miss just like has_key().
+
+    Args:
+        keys: Keys to check
+        fresh_only: Only consider fresh (non-stale) entries
+
+    Returns:
+        bool: True if all keys exist and meet freshness criteria
+    """
+    found = self.get_many(keys, include_stale=not fresh_only)
+    return len(found) == len(set(keys))
+
   def invalidate(self, key: str) -> bool:
     """
     Invalidate a specific cache entry.
@@ -392,7 +505,7 @@ class CacheManager:
     """
     with self._cache_lock:
       if key in self._cache:
-        del self._cache[key]
+        self._remove_entry(key)
         logger.debug("Deleted cache entry for key '%s'", key)
         return True
 
@@ -413,6 +526,7 @@ class CacheManager:
       if category is None:
         count = len(self._cache)
         self._cache.clear()
+        self._category_counts.clear()
         logger.info("Cleared all %d cache entries", count)
       else:
         keys_to_remove = [
@@ -420,7 +534,7 @@ class CacheManager:
             if entry.category == category
         ]
         for key in keys_to_remove:
-          del self._cache[key]
+          self._remove_entry(key)
           count += 1
         logger.info("Cleared %d cache entries in category '%s'", count, category)
 
@@ -441,7 +555,7 @@ class CacheManager:
       ]
 
       for key in keys_to_remove:
-        del self._cache[key]
+        self._remove_entry(key)
         count += 1
 
     if count > 0:
@@ -504,6 +618,11 @@ class CacheManager:
           newest_entry_age=self._stats.newest_entry_age
       )
 
+  def reset_stats(self) -> None:
+    """Reset the accumulated hit, miss, set, invalidation and cleanup counters."""
+    with self._stats_lock:
+      self._stats = CacheStats()
+
   def get_keys(self, category: Optional[str] = None) -> List[str]:
     """
     Get all cache keys, optionally filtered by category.
@@ -523,6 +642,21 @@ class CacheManager:
             if entry.category == category
         ]
 
+  def count(self, category: Optional[str] = None) -> int:
+    """
+    Count cache entries, optionally filtered by category.
+
+    Args:
+        category: If specified, only count entries in this category
+
+    Returns:
+        int: Number of cache entries
+    """
+    with self._cache_lock:
+      if category is None:
+        return len(self._cache)
+      return self._category_counts.get(category, 0)
+
   def get_all_entries(self, category: Optional[str] = None) -> Dict[str, CacheEntry]:
     """
     Get all cache entries, optionally filtered by category.
@@ -546,10 +680,23 @@ class CacheManager:
     """Remove the oldest cache entry to make room for new ones."""
     if not self._cache:
       return    # Find the oldest entry by timestamp
-    oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].timestamp)
-    del self._cache[oldest_key]
+    oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].created_ns)
+    self._remove_entry(oldest_key)
     logger.debug("Evicted oldest cache entry: %s", oldest_key)
 
+  def _remove_entry(self, key: str) -> None:
+    """Remove an entry and update the category counts. The caller must hold the cache lock."""
+    entry = self._cache.pop(key)
+    self._uncount_category(entry.category)
+
+  def _uncount_category(self, category: str) -> None:
+    """Decrement a category's entry count, dropping it once it reaches zero."""
+    remaining = self._category_counts[category] - 1
+    if remaining:
+      self._category_counts[category] = remaining
+    else:
+      del self._category_counts[category]
+
   def _start_cleanup_thread(self) -> None:
     """Start the background cleanup thread."""
     def cleanup_worker():
@@ -15,20 +15,24 @@ Key Features:
 """
 
 import asyncio
+import heapq
 import logging
+import math
 import threading
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from concurrent.futures import Future, ThreadPoolExecutor
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Longest single wait wait_for_status_change makes in a worker thread, so a cancelled wait frees its thread quickly
+_STATUS_WAIT_SLICE = 1.0
+
 
 class Priority(Enum):
   """Command execution priority levels."""
@@ -65,13 +69,15 @@ class Command:
 @dataclass
 class CommandBlock:
   """Represents a block of commands that must be executed sequentially."""
-  commands: List[Command]
+  commands: Sequence[Command]
   description: str = ""
   block_timeout: Optional[int] = None
   metadata: Dict[str, Any] = field(default_factory=dict)
 
   def __post_init__(self):
     """Validate command block after initialization."""
+    # Store the commands as a tuple so the block does not share a caller's list
+    self.commands: Tuple[Command, ...] = tuple(self.commands)
     if not self.commands:
       raise ValueError("Command block cannot be empty")
 
@@ -83,7 +89,7 @@ class CommandBlock:
     """Add a command to the block."""
     if isinstance(command, str):
       command = Command(command_text=command, timeout=timeout)
-    self.commands.append(command)
+    self.commands += (command,)
 
     # Update block timeout
     if self.block_timeout is not None:
@@ -241,7 +247,10 @@ class CommandQueue:
     self.max_result_history = max_result_history
 
     # Queue management
-    self._queue: deque = deque()
+    # Heap of (priority value, sequence number, item) entries: the lowest priority value comes out first, and the
+    # sequence number keeps items of equal priority in FIFO order without ever comparing the items themselves
+    self._queue: List[Tuple[int, int, QueueItem]] = []
+    self._next_seq = 0
     self._queue_lock = threading.RLock()
     self._processing_lock = threading.Lock()
     self._is_processing = False
@@ -251,6 +260,14 @@ class CommandQueue:
     self._completed_items: Dict[str, QueueItem] = {}
     self._completed_lock = threading.RLock()
 
+    # Incremented whenever the queue status changes. get_status() reports it, and each waiter compares it against the
+    # version it last saw, so no caller can consume a change another caller is waiting for
+    self._status_version = 0
+    self._status_changed = threading.Condition()
+
+    # Set when items are added, so an idle worker wakes up straight away
+    self._work_event = threading.Event()
+
     # Worker thread
     self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="command_queue")
     self._worker_future: Optional[Future] = None
@@ -293,12 +310,48 @@ class CommandQueue:
     if self._shutdown_requested:
       raise RuntimeError("Queue is shutting down")
 
+    return self._add_queue_item(self._create_command_item(command, timeout, priority, description))
+
+  def add_commands(self,
+                   commands: Iterable[Union[str, Command]],
+                   timeout: int = 30,
+                   priority: Priority = Priority.NORMAL) -> List[QueueResult]:
+    """
+    Add several commands to the queue at once.
+
+    The commands are queued in one go, so the worker only has to be woken once
+    and cannot start on the batch until all of it is queued.
+
+    Args:
+        commands: Command strings or Command objects
+        timeout: Timeout in seconds for commands given as strings
+        priority: Execution priority for every command
+
+    Returns:
+        QueueResult objects for tracking completion, in the same order as the commands
+
+    Raises:
+        ValueError: If the queue does not have room for all the commands
+        RuntimeError: If queue is shutting down
+    """
+    if self._shutdown_requested:
+      raise RuntimeError("Queue is shutting down")
+
+    queue_items = [self._create_command_item(command, timeout, priority, "") for command in commands]
+    with self._queue_lock:
+      if len(self._queue) + len(queue_items) > self.max_queue_size:
+        raise ValueError(f"Queue is full (max size: {self.max_queue_size})")
+      return [self._add_queue_item(queue_item) for queue_item in queue_items]
+
+  @staticmethod
+  def _create_command_item(command: Union[str, Command], timeout: int, priority: Priority,
+                           description: str) -> QueueItem:
+    """Create the queue item for a single command."""
     # Convert string to Command object if needed
     if isinstance(command, str):
       command = Command(command_text=command, timeout=timeout)
 
-    # Create queue item
-    queue_item = QueueItem(
+    return QueueItem(
         queue_id=str(uuid.uuid4()),
         priority=priority,
         timestamp=datetime.now(),
@@ -307,8 +360,6 @@ class CommandQueue:
         command=command
     )
 
-    return self._add_queue_item(queue_item)
-
   def add_command_block(self,
                         command_block: CommandBlock,
                         priority: Priority = Priority.NORMAL,
@@ -355,18 +406,15 @@ class CommandQueue:
       # Create future immediately when adding to queue
       queue_item.future = Future()
 
-      # Insert based on priority (higher priority = lower enum value)
-      inserted = False
-      for i, existing_item in enumerate(self._queue):
-        if queue_item.priority.value < existing_item.priority.value:
-          self._queue.insert(i, queue_item)
-          position = i + 1
-          inserted = True
-          break
+      # Insert based on priority (higher priority = lower enum value); the item goes after everything already
+      # queued with the same or a higher priority
+      priority_value = queue_item.priority.value
+      position = 1 + sum(1 for entry in self._queue if entry[0] <= priority_value)
+      heapq.heappush(self._queue, (priority_value, self._next_seq, queue_item))
+      self._next_seq += 1
 
-      if not inserted:
-        self._queue.append(queue_item)
-        position = len(self._queue)
+      self._notify_status_change()
+      self._work_event.set()
 
       logger.info("Added %s to queue at position %d (ID: %s)",
                   queue_item.get_description(), position, queue_item.queue_id)
@@ -375,9 +423,13 @@ class CommandQueue:
 
   def get_status(self) -> Dict[str, Any]:
     """Get current queue status information."""
+    # Read the version first, so a change made while the snapshot is taken still counts as a change after it
+    with self._status_changed:
+      status_version = self._status_version
+
     with self._queue_lock:
       queue_items = []
-      for item in self._queue:
+      for _, _, item in sorted(self._queue):
         queue_items.append({
             'queue_id': item.queue_id,
             'description': item.get_description(),
@@ -412,9 +464,49 @@ class CommandQueue:
         'completed_count': completed_count,
         'queue_items': queue_items,
         'recent_completed': recent_completed,
-        'container_name': self.container_name
+        'container_name': self.container_name,
+        'status_version': status_version
     }
 
+  async def wait_for_status_change(self, since_version: int, timeout: float) -> bool:
+    """
+    Wait until the queue status changes from the version a get_status() call reported.
+
+    Args:
+        since_version: The 'status_version' from the get_status() result to compare against
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the status changed, False if the timeout expired first
+
+    Raises:
+        ValueError: If timeout is None, negative or infinite
+    """
+    if timeout is None or not 0 <= timeout < math.inf:
+      raise ValueError("timeout must be a finite, non-negative number of seconds")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+      # Wait in bounded slices, so a cancelled wait leaves its worker thread blocked for one slice at most
+      remaining = deadline - loop.time()
+      wait_time = min(max(remaining, 0.0), _STATUS_WAIT_SLICE)
+      if await loop.run_in_executor(None, self._wait_for_version_change, since_version, wait_time):
+        return True
+      if remaining <= _STATUS_WAIT_SLICE:
+        return False
+
+  def _wait_for_version_change(self, since_version: int, timeout: float) -> bool:
+    """Block until the status version differs from since_version, for at most timeout seconds."""
+    with self._status_changed:
+      return self._status_changed.wait_for(lambda: self._status_version != since_version, timeout)
+
+  def _notify_status_change(self) -> None:
+    """Record a queue status change and wake everything waiting for one."""
+    with self._status_changed:
+      self._status_version += 1
+      self._status_changed.notify_all()
+
   def clear_queue(self) -> int:
     """
     Clear all pending commands from the queue.
@@ -425,13 +517,14 @@ class CommandQueue:
     with self._queue_lock:
       count = len(self._queue)
       # Mark all queued items as cancelled
-      for item in self._queue:
+      for _, _, item in self._queue:
         if item.status == CommandStatus.QUEUED:
           item.status = CommandStatus.CANCELLED
           if item.future:
             item.future.cancel()
 
       self._queue.clear()
+      self._notify_status_change()
       logger.info("Cleared %d items from queue", count)
       return count
 
@@ -450,6 +543,7 @@ class CommandQueue:
     """
     logger.info("Shutting down command queue...")
     self._shutdown_requested = True
+    self._work_event.set()
 
     # Clear remaining queue
     self.clear_queue()    # Shutdown executor
@@ -469,8 +563,10 @@ class CommandQueue:
       logger.info("Command queue worker started")
       while not self._shutdown_requested:
         try:
-          self._process_next_item()
-          time.sleep(0.1)  # Small delay to prevent busy waiting
+          # Clear before checking the queue, so an item added after the check still wakes the wait below
+          self._work_event.clear()
+          if not self._process_next_item():
+            self._work_event.wait(0.1)  # Idle until an item is added, re-checking now and then
         except (RuntimeError, ValueError, AttributeError, OSError) as e:
           logger.error("Error in queue worker: %s", str(e))
           time.sleep(1)  # Longer delay on error
@@ -482,15 +578,21 @@ class CommandQueue:
 
     self._worker_future = self._executor.submit(worker)
 
-  def _process_next_item(self) -> None:
-    """Process the next item in the queue."""
+  def _process_next_item(self) -> bool:
+    """
+    Process the next item in the queue.
+
+    Returns:
+        True if an item was processed, False if there was nothing to do
+    """
     with self._queue_lock:
       if not self._queue or self._is_processing:
-        return
+        return False
 
-      item = self._queue.popleft()    # Set processing flag
+      _, _, item = heapq.heappop(self._queue)    # Set processing flag
     with self._processing_lock:
       self._is_processing = True
+    self._notify_status_change()
 
     try:
       # Use the existing future that was created when adding to queue
@@ -550,6 +652,9 @@ class CommandQueue:
       # Clear processing flag
       with self._processing_lock:
         self._is_processing = False
+      self._notify_status_change()
+
+    return True
 
   def _execute_item(self, item: QueueItem) -> ExecutionResult:
     """Execute a single queue item (command or command block)."""
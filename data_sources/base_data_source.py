@@ -17,6 +17,13 @@ class BaseDataSource(ABC):
   This interface defines all the operations that data sources must support
   to be compatible with the API endpoints. Implementations can provide
   live data (from actual containers) or stub data (for testing).
+
+  The getters may block: the API manager calls get_server_status,
+  get_worlds_data and get_container_status in a worker thread, or awaits
+  them directly if an implementation makes them coroutines.
+  get_structured_command_response is called the same way, so it also runs
+  off the event loop thread. The API manager holds a lock around it, so only
+  one command runs at a time, though a command may overlap those getters.
   """
 
   # Container Management Operations
@@ -7,6 +7,7 @@ and frontend development.
 """
 
 import logging
+import os
 import random
 import time
 import threading
@@ -19,6 +20,18 @@ from data_sources.base_data_source import BaseDataSource  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Multiplier for the delays that simulate container and command processing time, from the STUB_DELAY_SCALE environment
+# variable. The default of 0 skips them so the API layer can be load tested; set it to 1 for realistic timings
+try:
+  _DELAY_SCALE = max(0.0, float(os.getenv("STUB_DELAY_SCALE", "0")))
+except ValueError:
+  logger.warning("Invalid STUB_DELAY_SCALE value, simulated delays are disabled")
+  _DELAY_SCALE = 0.0
+
+# Every uptime a stub world can report, 5 to 240 minutes, formatted once instead of for each world
+_UPTIME_STRINGS = tuple(f"{minutes // 60}h {minutes % 60}m" if minutes >= 60 else f"{minutes}m"
+                        for minutes in range(5, 241))
+
 
 class StubDataSource(BaseDataSource):
   """
@@ -28,6 +41,22 @@ class StubDataSource(BaseDataSource):
   test data for development and testing purposes.
   """
 
+  # Templates for _generate_log_entry, formatted with the current time and, where the template uses it, a user name
+  _LOG_TEMPLATES = (
+      "[{time}] User joined: {user}",
+      "[{time}] User left: {user}",
+      "[{time}] World save completed",
+      "[{time}] Network sync update",
+      "[{time}] Asset cache refreshed",
+  )
+
+  # Choices for the generated worlds and users data, kept here so they are not rebuilt for every world and user
+  _ACCESS_LEVELS = ("Private", "Friends", "FriendsOfFriends", "RegisteredUsers", "Anyone")
+  _WORLD_TAGS = ("Creative", "Social", "Educational", "Gaming", "Art", "Music")
+  _USER_ROLES = ("Guest", "Builder", "Moderator", "Admin")
+  _USER_PLATFORMS = ("Desktop", "VR", "Mobile")
+  _BOOLEANS = (True, False)
+
   def __init__(self, container_name: str = "resonite-headless", config_file: str = "config.json"):
     """
     Initialize the stub data source.
@@ -395,30 +424,33 @@ class StubDataSource(BaseDataSource):
 
   def _generate_initial_logs(self) -> None:
     """Generate some initial log entries for realistic behavior."""
+    timestamp = datetime.now().isoformat()
     sample_logs = [
         "Starting Resonite headless server...",
         "Loading world data...",
         "Initializing physics engine...",
         "Starting network services...",
         "Server ready for connections",
-        f"{datetime.now().isoformat()}: User connected: Alice_VR",
-        f"{datetime.now().isoformat()}: World loaded: Crystal Caverns",
-        f"{datetime.now().isoformat()}: Network sync established",
-        f"{datetime.now().isoformat()}: Asset cache updated",
-        f"{datetime.now().isoformat()}: User activity detected"
+        f"{timestamp}: User connected: Alice_VR",
+        f"{timestamp}: World loaded: Crystal Caverns",
+        f"{timestamp}: Network sync established",
+        f"{timestamp}: Asset cache updated",
+        f"{timestamp}: User activity detected"
     ]
     self._log_buffer.extend(sample_logs)
 
   def _generate_log_entry(self) -> str:
     """Generate a realistic log entry."""
-    log_types = [
-        f"[{datetime.now().strftime('%H:%M:%S')}] User joined: {random.choice(self.user_names)}",
-        f"[{datetime.now().strftime('%H:%M:%S')}] User left: {random.choice(self.user_names)}",
-        f"[{datetime.now().strftime('%H:%M:%S')}] World save completed",
-        f"[{datetime.now().strftime('%H:%M:%S')}] Network sync update",
-        f"[{datetime.now().strftime('%H:%M:%S')}] Asset cache refreshed"
-    ]
-    return random.choice(log_types)
+    # Pick the template first so only the chosen line is formatted
+    template = random.choice(self._LOG_TEMPLATES)
+    user = random.choice(self.user_names) if "{user}" in template else ""
+    return template.format(time=datetime.now().strftime('%H:%M:%S'), user=user)
+
+  @staticmethod
+  def _simulate_delay(seconds: float) -> None:
+    """Sleep for a simulated processing time, scaled by STUB_DELAY_SCALE."""
+    if _DELAY_SCALE:
+      time.sleep(seconds * _DELAY_SCALE)
 
   # Container Management Operations
   def is_container_running(self) -> bool:
@@ -435,7 +467,7 @@ class StubDataSource(BaseDataSource):
     self._container_running = True
 
     # Simulate startup delay
-    time.sleep(0.5)
+    self._simulate_delay(0.5)
 
     # Add startup log entry
     startup_log = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [INFO] Container started successfully"
@@ -468,7 +500,7 @@ class StubDataSource(BaseDataSource):
 
     try:
       self.stop_container()
-      time.sleep(1)  # Simulate restart delay
+      self._simulate_delay(1)  # Simulate restart delay
       self.start_container()
       return True
     except (OSError, RuntimeError) as e:
@@ -572,7 +604,7 @@ class StubDataSource(BaseDataSource):
       # Direct command execution, no prefix handling
       logger.info("Executing direct command: %s", command)
       # Simulate command processing delay
-      time.sleep(random.uniform(0.1, 0.5))
+      self._simulate_delay(random.uniform(0.1, 0.5))
 
       # direct commands do not have structured responses, just return the output
       # this is more intended for use on the console,
@@ -606,7 +638,7 @@ class StubDataSource(BaseDataSource):
       logger.info("Executing structured command (simulated): %s", command)
 
       # Simulate command processing delay
-      time.sleep(random.uniform(0.1, 0.5))
+      self._simulate_delay(random.uniform(0.1, 0.5))
 
       # Use current timestamp for all responses
       current_timestamp = datetime.now().isoformat()
@@ -851,10 +883,17 @@ class StubDataSource(BaseDataSource):
   def get_worlds_data(self) -> List[Dict[str, Any]]:
     """Generate realistic worlds data matching test server format."""
     num_worlds = random.randint(1, 4)
+    # Draw the choices that don't depend on each other for every world at once
+    world_names = random.choices(self.world_names, k=num_worlds)
+    uptimes = random.choices(_UPTIME_STRINGS, k=num_worlds)
+    access_levels = random.choices(self._ACCESS_LEVELS, k=num_worlds)
+    mobile_flags = random.choices(self._BOOLEANS, k=num_worlds)
+    alt_access_levels = random.choices(self._ACCESS_LEVELS, k=num_worlds)
+    alt_mobile_flags = random.choices(self._BOOLEANS, k=num_worlds)
     worlds = []
 
-    for _ in range(num_worlds):
-      world_name = random.choice(self.world_names)
+    for world_name, uptime, access_level, mobile_flag, alt_access_level, alt_mobile_flag in zip(
+        world_names, uptimes, access_levels, mobile_flags, alt_access_levels, alt_mobile_flags):
       users_count = random.randint(1, 8)
       max_users = random.randint(max(users_count, 5), 20)
       present_users = random.randint(1, users_count)
@@ -862,10 +901,6 @@ class StubDataSource(BaseDataSource):
       # Generate session ID
       session_id = f"S-{random.randint(100000, 999999)}"
 
-      # Calculate uptime
-      uptime_minutes = random.randint(5, 240)
-      uptime = f"{uptime_minutes // 60}h {uptime_minutes % 60}m" if uptime_minutes >= 60 else f"{uptime_minutes}m"
-
       world = {
           "name": world_name,
           "sessionId": session_id,
@@ -873,17 +908,17 @@ class StubDataSource(BaseDataSource):
           "present": present_users,
           "maxUsers": max_users,
           "uptime": uptime,
-          "accessLevel": random.choice(["Private", "Friends", "FriendsOfFriends", "RegisteredUsers", "Anyone"]),
-          "mobileFriendly": random.choice([True, False]),
+          "accessLevel": access_level,
+          "mobileFriendly": mobile_flag,
           "description": f"A beautiful {world_name.lower()} world for exploration and creativity",
-          "tags": random.sample(["Creative", "Social", "Educational", "Gaming", "Art", "Music"], 2),
+          "tags": random.sample(self._WORLD_TAGS, 2),
           "user_count": {
               "connected_to_instance": users_count,
               "present": present_users,
               "max_users": max_users
           },
-          "access_level": random.choice(["Private", "Friends", "FriendsOfFriends", "RegisteredUsers", "Anyone"]),
-          "mobile_friendly": random.choice([True, False])
+          "access_level": alt_access_level,
+          "mobile_friendly": alt_mobile_flag
       }
       worlds.append(world)
 
@@ -892,17 +927,21 @@ class StubDataSource(BaseDataSource):
   def get_users_data(self) -> List[Dict[str, Any]]:
     """Generate users data for a world matching test server format."""
     num_users = random.randint(2, 6)
+    # Draw each field's choices for every user at once
+    usernames = random.choices(self.user_names, k=num_users)
+    roles = random.choices(self._USER_ROLES, k=num_users)
+    presence = random.choices(self._BOOLEANS, k=num_users)
+    platforms = random.choices(self._USER_PLATFORMS, k=num_users)
     users = []
 
-    for _ in range(num_users):
-      username = random.choice(self.user_names)
+    for username, role, is_present, platform in zip(usernames, roles, presence, platforms):
       user = {
           "username": username,
           "id": f"U-{random.randint(100000, 999999)}",
-          "role": random.choice(["Guest", "Builder", "Moderator", "Admin"]),
+          "role": role,
           "sessionTime": f"{random.randint(5, 120)}m",
-          "isPresent": random.choice([True, False]),
-          "platform": random.choice(["Desktop", "VR", "Mobile"])
+          "isPresent": is_present,
+          "platform": platform
       }
       users.append(user)
 
@@ -910,7 +949,8 @@ class StubDataSource(BaseDataSource):
 
   def get_server_status(self) -> Dict[str, Any]:
     """Generate server status matching test server format."""
-    uptime = datetime.now() - self.start_time
+    now = datetime.now()
+    uptime = now - self.start_time
     uptime_str = str(uptime).split('.', maxsplit=1)[0]  # Remove microseconds
 
     worlds_data = self.get_worlds_data()
@@ -920,7 +960,7 @@ class StubDataSource(BaseDataSource):
         "version": "2024.3.28",
         "worlds_active": len(worlds_data),
         "total_users": sum(world["users"] for world in worlds_data),
-        "server_time": datetime.now().isoformat()
+        "server_time": now.isoformat()
     }
 
   def get_headless_config(self) -> Dict[str, Any]:
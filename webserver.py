@@ -1,3 +1,5 @@
+import functools
+
 from fastapi import FastAPI
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -8,10 +10,16 @@ app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 
+@functools.lru_cache(maxsize=1)
+def _index_html() -> bytes:
+  """Read the web interface page once, on the first request."""
+  with open("templates/index.html", "rb") as f:
+    return f.read()
+
+
 @app.get("/")
 async def get():
-  with open("templates/index.html", encoding='utf-8') as f:
-    return HTMLResponse(f.read())
+  return HTMLResponse(_index_html())
 
 if __name__ == "__main__":
   import uvicorn